@@ -38,6 +38,9 @@ setup(
         'dev': [
             'pytest>=7.0.0',
             'pytest-cov>=4.0.0',
+            'pytest-xdist>=3.0.0',
+            'pytest-benchmark>=4.0.0',
+            'hypothesis>=6.0.0',
             'mypy>=1.0.0',
             'black>=23.0.0',
             'isort>=5.12.0',
@@ -46,6 +49,10 @@ setup(
             'pqcrypto>=0.1.3',
             'liboqs-python>=0.8.0',
         ],
+        'speedups': [
+            'numba>=0.57.0',
+            'orjson>=3.9.0',
+        ],
     },
     entry_points={
         'console_scripts': [
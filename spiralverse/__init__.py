@@ -12,6 +12,10 @@ __version__ = '0.1.0'
 __author__ = 'Isaac Davis'
 __email__ = 'issdandavis@github.com'
 
+import hashlib
+
+import numpy as np
+
 # Core imports
 from spiralverse.core.sacred_tongues import (
     SacredTongue,
@@ -37,6 +41,9 @@ from spiralverse.crypto.pqc_module import (
 class AetherMooreCipher:
     """Main cipher class combining PQC and Sacred Tongues"""
     
+    # Domain separation for the shared-secret keystream
+    KEYSTREAM_DOMAIN = b'AMC/ks'
+    
     def __init__(self, security_level: SecurityLevel = SecurityLevel.LEVEL_5):
         self.pqc = PQCModule(security_level)
         self.tongues = SixTonguesLayer()
@@ -52,21 +59,28 @@ class AetherMooreCipher:
         encoded = self.tongues.full_encode(plaintext)
         # Encapsulate with Kyber
         ct, ss = self.pqc.encapsulate(public_key)
-        # XOR with shared secret for symmetric encryption
-        encrypted = bytes(e ^ s for e, s in zip(encoded, (ss * (len(encoded) // 32 + 1))[:len(encoded)]))
-        return ct + encrypted
+        # XOR with a keystream expanded from the shared secret
+        keystream = hashlib.shake_256(self.KEYSTREAM_DOMAIN + ss).digest(len(encoded))
+        a = np.frombuffer(encoded, dtype=np.uint8)
+        b = np.frombuffer(keystream, dtype=np.uint8)
+        # Join straight from the XOR result to skip an intermediate bytes copy
+        return b''.join((ct, np.bitwise_xor(a, b)))
     
     def decrypt(self, ciphertext: bytes, private_key: KyberPrivateKey) -> bytes:
         """Decrypt with PQC + Sacred Tongues"""
-        # Split ciphertext
-        ct = ciphertext[:self.pqc.kem.CT_SIZE]
-        encrypted = ciphertext[self.pqc.kem.CT_SIZE:]
+        # Split ciphertext without copying the payload
+        view = memoryview(ciphertext)
+        ct = bytes(view[:self.pqc.kem.CT_SIZE])
+        encrypted = view[self.pqc.kem.CT_SIZE:]
         # Decapsulate to get shared secret
         ss = self.pqc.decapsulate(private_key, ct)
-        # XOR to decrypt
-        decoded = bytes(e ^ s for e, s in zip(encrypted, (ss * (len(encrypted) // 32 + 1))[:len(encrypted)]))
+        # XOR with the same shared-secret keystream to decrypt
+        keystream = hashlib.shake_256(self.KEYSTREAM_DOMAIN + ss).digest(len(encrypted))
+        a = np.frombuffer(encrypted, dtype=np.uint8)
+        b = np.frombuffer(keystream, dtype=np.uint8)
+        decoded = np.bitwise_xor(a, b)
         # Reverse Sacred Tongues encoding
-        return self.tongues.full_decode(decoded)
+        return self.tongues.full_decode(memoryview(decoded))
 
 
 __all__ = [
@@ -12,12 +12,18 @@ The Six Sacred Tongues:
 - Drakmori: Binding/Seal - Authentication tags
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Callable
 from enum import Enum
+import functools
 import hashlib
 import secrets
 
+import numpy as np
+
+from spiralverse.crypto.keccak import shake_256_batch
+
 
 class SacredTongue(Enum):
     """The Six Sacred Tongues of the Spiralverse"""
@@ -29,6 +35,10 @@ class SacredTongue(Enum):
     DRAKMORI = "drakmori"    # Binding/Seal
 
 
+# Every tongue in enumeration order; iterated instead of the Enum itself
+_ALL = tuple(SacredTongue)
+
+
 @dataclass
 class TongueWeight:
     """Weighting coefficient for a Sacred Tongue"""
@@ -41,14 +51,94 @@ class TongueWeight:
         return self.weight * self.harmonic_factor
 
 
+# Row of each tongue in the LanguesWeight arrays
+_TONGUE_INDEX = {tongue: i for i, tongue in enumerate(_ALL)}
+
+
+class _TongueWeightView(TongueWeight):
+    """TongueWeight backed by one row of its LanguesWeight arrays"""
+    
+    def __init__(self, owner: 'LanguesWeight', tongue: SacredTongue):
+        self._owner = owner
+        self._index = _TONGUE_INDEX[tongue]
+        self.tongue = tongue
+    
+    @property
+    def weight(self) -> float:
+        return float(self._owner._w[self._index])
+    
+    @weight.setter
+    def weight(self, value: float):
+        self._owner._w[self._index] = value
+        self._owner._version += 1
+    
+    @property
+    def harmonic_factor(self) -> float:
+        return float(self._owner._h[self._index])
+    
+    @harmonic_factor.setter
+    def harmonic_factor(self, value: float):
+        self._owner._h[self._index] = value
+        self._owner._version += 1
+    
+    def _snapshot(self) -> TongueWeight:
+        return TongueWeight(self.tongue, self.weight, self.harmonic_factor)
+    
+    def __repr__(self) -> str:
+        return repr(self._snapshot())
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _TongueWeightView):
+            other = other._snapshot()
+        return self._snapshot() == other
+    
+    def __reduce__(self):
+        # Copies are detached TongueWeight values
+        return TongueWeight, (self.tongue, self.weight, self.harmonic_factor)
+
+
+class _TongueWeights(dict):
+    """Read-only ``LanguesWeight.weights``; weights change through set_weight
+    
+    Rebuilding the mapping from items, as copy, pickle and dataclasses.asdict
+    do, yields a plain dict.
+    """
+    __slots__ = ()
+    
+    def __new__(cls, *args, **kwargs):
+        return dict(*args, **kwargs)
+    
+    @classmethod
+    def _empty(cls) -> '_TongueWeights':
+        return dict.__new__(cls)
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('LanguesWeight.weights is read-only; use set_weight()')
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    update = setdefault = pop = popitem = clear = _read_only
+
+
 @dataclass
 class LanguesWeight:
-    """Langues Weighting System (LWS) configuration"""
+    """Langues Weighting System (LWS) configuration
+    
+    Weights and harmonic factors live in parallel NumPy arrays indexed by
+    tongue; ``weights`` is a read-only mapping from each configured tongue
+    to a TongueWeight view onto its row, so edits through either API stay
+    in sync. Add or replace tongues with set_weight.
+    """
     weights: Dict[SacredTongue, TongueWeight] = field(default_factory=dict)
     
     def __post_init__(self):
-        if not self.weights:
+        self._version = 0
+        self._w = np.zeros(len(_ALL), dtype=np.float64)
+        self._h = np.ones(len(_ALL), dtype=np.float64)
+        configured, self.weights = self.weights, _TongueWeights._empty()
+        if not configured:
             self._initialize_default_weights()
+        for tongue, tw in configured.items():
+            self.set_weight(tongue, tw.weight, tw.harmonic_factor)
     
     def _initialize_default_weights(self):
         """Initialize balanced default weights"""
@@ -61,18 +151,67 @@ class LanguesWeight:
             SacredTongue.DRAKMORI: 0.15,   # Authentication
         }
         for tongue, weight in default.items():
-            self.weights[tongue] = TongueWeight(tongue, weight)
+            self.set_weight(tongue, weight)
+    
+    def effective_weights(self) -> np.ndarray:
+        """Effective weight of every tongue, in SacredTongue order"""
+        return self._w * self._h
     
     def normalize(self):
         """Normalize weights to sum to 1.0"""
-        total = sum(tw.effective_weight for tw in self.weights.values())
+        total = float(self.effective_weights().sum())
         if total > 0:
-            for tw in self.weights.values():
-                tw.weight = tw.weight / total
+            self._w /= total
+            self._version += 1
+    
+    def set_weight(self, tongue: SacredTongue, weight: float,
+                   harmonic_factor: Optional[float] = None):
+        """Set the base weight (and optionally harmonic factor) of a tongue"""
+        i = _TONGUE_INDEX[tongue]
+        if tongue not in self.weights:
+            dict.__setitem__(self.weights, tongue, _TongueWeightView(self, tongue))
+        self._w[i] = weight
+        if harmonic_factor is not None:
+            self._h[i] = harmonic_factor
+        self._version += 1
+    
+    def __reduce__(self):
+        # Rebuild copies and pickles from plain (tongue, weight, harmonic) values
+        return type(self), ({tongue: tw._snapshot() for tongue, tw in self.weights.items()},)
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped on every weight change"""
+        return self._version
     
     def get_weight(self, tongue: SacredTongue) -> float:
         """Get effective weight for a tongue"""
-        return self.weights.get(tongue, TongueWeight(tongue, 0.0)).effective_weight
+        i = _TONGUE_INDEX[tongue]
+        return float(self._w[i] * self._h[i])
+
+
+# Longest keystream kept in the SHAKE cache; longer expansions are computed directly
+_SHAKE_CACHE_MAX_LENGTH = 1 << 14
+
+
+@functools.lru_cache(maxsize=1024)
+def _shake(seed: bytes, length: int) -> bytes:
+    """Memoized SHAKE-256 expansion of a tongue seed"""
+    return hashlib.shake_256(seed).digest(length)
+
+
+def _expand_seeds(seeds: List[bytes], length: int) -> List[bytes]:
+    """Expand tongue seeds to length bytes, through the cache when short enough"""
+    if length > _SHAKE_CACHE_MAX_LENGTH:
+        return shake_256_batch(seeds, length)
+    # SHAKE output is prefix-stable: cache a power-of-two bucket and slice it
+    bucket = 1 << max(length - 1, 0).bit_length()
+    return [_shake(seed, bucket)[:length] for seed in seeds]
+
+
+def _xor_keystream(data: bytes, key_stream: np.ndarray) -> bytes:
+    """XOR data against a fused keystream in a single vectorized pass"""
+    return np.bitwise_xor(np.frombuffer(data, dtype=np.uint8), key_stream).tobytes()
 
 
 class SacredTongueEncoder:
@@ -90,69 +229,105 @@ class SacredTongueEncoder:
     
     def __init__(self, lws: Optional[LanguesWeight] = None):
         self.lws = lws or LanguesWeight()
+        self.refresh_seeds()
+    
+    def refresh_seeds(self):
+        """Rebuild the per-tongue SHAKE seeds from the current LWS weights"""
+        self._seeds = {
+            tongue: self._tongue_seed(symbol, self.lws.get_weight(tongue))
+            for tongue, symbol in self.TONGUE_SYMBOLS.items()
+        }
+        self._seeds_version = self.lws.version
     
     def encode(self, data: bytes, tongue: SacredTongue) -> bytes:
         """Encode data using a specific Sacred Tongue"""
-        symbol = self.TONGUE_SYMBOLS[tongue]
-        weight = self.lws.get_weight(tongue)
-        
         # Apply tongue-specific transformation
-        transformed = self._transform(data, symbol, weight)
-        return transformed
+        return self._transform(data, self._seed(tongue))
     
     def decode(self, data: bytes, tongue: SacredTongue) -> bytes:
         """Decode data from a specific Sacred Tongue"""
-        symbol = self.TONGUE_SYMBOLS[tongue]
-        weight = self.lws.get_weight(tongue)
-        
         # Reverse tongue-specific transformation
-        return self._inverse_transform(data, symbol, weight)
+        return self._inverse_transform(data, self._seed(tongue))
+    
+    def _seed(self, tongue: SacredTongue) -> bytes:
+        """Cached SHAKE seed for a tongue, refreshed after LWS changes"""
+        if self._seeds_version != self.lws.version:
+            self.refresh_seeds()
+        return self._seeds[tongue]
     
-    def _transform(self, data: bytes, symbol: bytes, weight: float) -> bytes:
+    def _transform(self, data: bytes, seed: bytes) -> bytes:
         """Apply tongue transformation"""
         # XOR with weighted symbol expansion
-        key_stream = self._expand_symbol(symbol, len(data), weight)
-        return bytes(d ^ k for d, k in zip(data, key_stream))
+        n = len(data)
+        key_stream = _expand_seeds([seed], n)[0]
+        return (int.from_bytes(data, 'big') ^ int.from_bytes(key_stream, 'big')).to_bytes(n, 'big')
     
-    def _inverse_transform(self, data: bytes, symbol: bytes, weight: float) -> bytes:
+    def _inverse_transform(self, data: bytes, seed: bytes) -> bytes:
         """Reverse tongue transformation (XOR is self-inverse)"""
-        return self._transform(data, symbol, weight)
+        return self._transform(data, seed)
     
-    def _expand_symbol(self, symbol: bytes, length: int, weight: float) -> bytes:
-        """Expand symbol to required length with weight modulation"""
+    def _tongue_seed(self, symbol: bytes, weight: float) -> bytes:
+        """Build the SHAKE seed for a symbol at the given weight"""
         weight_byte = int(weight * 255) & 0xFF
-        seed = symbol + bytes([weight_byte])
-        return hashlib.shake_256(seed).digest(length)
+        return symbol + bytes([weight_byte])
 
 
 class SixTonguesLayer:
     """Full Six Sacred Tongues transformation layer"""
     
+    # Minimum effective weight for a tongue to take part in weighted_encode
+    WEIGHT_THRESHOLD = 0.1
+    # Number of fused keystreams kept per layer
+    KEYSTREAM_CACHE_SIZE = 64
+    
     def __init__(self, lws: Optional[LanguesWeight] = None):
         self.lws = lws or LanguesWeight()
         self.encoder = SacredTongueEncoder(self.lws)
+        self._ks_cache = OrderedDict()
+        self._ks_version = self.lws.version
+    
+    def invalidate_keystream(self):
+        """Drop cached fused keystreams (done automatically on LWS changes)"""
+        self._ks_cache.clear()
+        self._ks_version = self.lws.version
+    
+    def _fused_keystream(self, length: int,
+                         tongues: Optional[List[SacredTongue]] = None) -> np.ndarray:
+        """XOR of the tongue keystreams (XOR commutes, so order is irrelevant)"""
+        if tongues is None:
+            tongues = _ALL
+        if self._ks_version != self.lws.version:
+            self.invalidate_keystream()
+        key = (tuple(tongues), length)
+        fused = self._ks_cache.get(key)
+        if fused is not None:
+            self._ks_cache.move_to_end(key)
+            return fused
+        
+        seeds = [self.encoder._seed(tongue) for tongue in tongues]
+        # One contiguous (tongues, length) block reduced in a single NumPy pass
+        streams = np.frombuffer(b''.join(_expand_seeds(seeds, length)), dtype=np.uint8)
+        fused = np.bitwise_xor.reduce(streams.reshape(len(seeds), length), axis=0)
+        if length <= _SHAKE_CACHE_MAX_LENGTH:
+            fused.setflags(write=False)
+            self._ks_cache[key] = fused
+            if len(self._ks_cache) > self.KEYSTREAM_CACHE_SIZE:
+                self._ks_cache.popitem(last=False)
+        return fused
     
     def full_encode(self, data: bytes) -> bytes:
-        """Apply all six tongues in sequence"""
-        result = data
-        for tongue in SacredTongue:
-            result = self.encoder.encode(result, tongue)
-        return result
+        """Apply all six tongues in a single fused pass"""
+        return _xor_keystream(data, self._fused_keystream(len(data)))
     
     def full_decode(self, data: bytes) -> bytes:
-        """Reverse all six tongues in reverse sequence"""
-        result = data
-        for tongue in reversed(list(SacredTongue)):
-            result = self.encoder.decode(result, tongue)
-        return result
+        """Reverse all six tongues (the fused XOR is self-inverse)"""
+        return self.full_encode(data)
     
     def weighted_encode(self, data: bytes, active_tongues: List[SacredTongue]) -> bytes:
         """Apply selected tongues based on weight threshold"""
-        result = data
-        for tongue in active_tongues:
-            if self.lws.get_weight(tongue) > 0.1:  # Threshold
-                result = self.encoder.encode(result, tongue)
-        return result
+        selected = [tongue for tongue in active_tongues
+                    if self.lws.get_weight(tongue) > self.WEIGHT_THRESHOLD]
+        return _xor_keystream(data, self._fused_keystream(len(data), selected))
     
     def generate_authentication_tag(self, data: bytes) -> bytes:
         """Generate Drakmori authentication tag"""
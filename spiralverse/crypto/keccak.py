@@ -0,0 +1,59 @@
+"""Batched SHAKE-256 expansion for Spiralverse-AetherMoore
+
+Single entry point for expanding several independent seeds at once, as
+needed by the Six Sacred Tongues keystreams and the simulated PQC key
+derivations. Callers hand over the whole batch so the backend is free to
+process the seeds together instead of being driven one hash at a time.
+
+hashlib holds the GIL while squeezing a SHAKE digest, so on a regular
+interpreter threads cannot speed the batch up and the seeds are expanded
+in turn. On free-threaded builds long expansions are spread over a small
+thread pool instead.
+"""
+
+import functools
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence, Union
+
+
+# Shortest per-seed output worth handing to the thread pool
+_PARALLEL_MIN_LENGTH = 1 << 16
+# One worker per Sacred Tongue at most
+_MAX_WORKERS = 6
+
+
+def _gil_enabled() -> bool:
+    """Whether the interpreter serialises threads (always true before 3.13)"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+@functools.lru_cache(maxsize=None)
+def _pool() -> ThreadPoolExecutor:
+    """Shared expansion pool, created on first parallel batch"""
+    return ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, os.cpu_count() or 1),
+                              thread_name_prefix='shake256')
+
+
+def _digest(seed: bytes, n: int) -> bytes:
+    return hashlib.shake_256(seed).digest(n)
+
+
+def shake_256_batch(seeds: Sequence[bytes],
+                    lengths: Union[int, Sequence[int]]) -> List[bytes]:
+    """Expand each seed with SHAKE-256 to its requested output length
+
+    ``lengths`` is either one length shared by every seed or a sequence
+    with one length per seed.
+    """
+    if isinstance(lengths, int):
+        lengths = [lengths] * len(seeds)
+    if len(lengths) != len(seeds):
+        raise ValueError('seeds and lengths must have the same number of items')
+    if (len(seeds) > 1 and max(lengths) >= _PARALLEL_MIN_LENGTH
+            and not _gil_enabled()):
+        return list(_pool().map(_digest, seeds, lengths))
+    return [_digest(seed, n) for seed, n in zip(seeds, lengths)]
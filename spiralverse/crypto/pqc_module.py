@@ -7,12 +7,23 @@ Implements NIST PQC standards:
 Integrated with Harmonic Scaling Law H(d,R) and Six Sacred Tongues.
 """
 
+import functools
 import hashlib
+import importlib.util
 import secrets
 from dataclasses import dataclass
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 from enum import Enum
 
+import numpy as np
+
+from spiralverse.crypto.keccak import shake_256_batch
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional speedup
+    njit = None
+
 
 class SecurityLevel(Enum):
     """NIST Security Levels for PQC"""
@@ -52,20 +63,56 @@ class DilithiumPrivateKey:
     security_level: SecurityLevel = SecurityLevel.LEVEL_5
 
 
+# Smallest R for which the JIT kernel is used instead of the NumPy reduction
+_NUMBA_MIN_R = 100_000
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _harmonic_sum(d: float, R: int) -> float:
+        """Parallel H(d,R) reduction without a temporary array"""
+        total = 0.0
+        for n in prange(1, R + 1):
+            total += 1.0 / (n ** d)
+        return total
+else:
+    _harmonic_sum = None
+
+
+# Largest integer d evaluated by repeated multiplication instead of pow()
+_INT_POW_MAX_D = 8
+
+
+def _powers(n: np.ndarray, d: float) -> np.ndarray:
+    """n**d, using plain multiplies when d is a small positive integer"""
+    if float(d).is_integer() and 1 <= d <= _INT_POW_MAX_D:
+        denom = n.copy()
+        for _ in range(int(d) - 1):
+            denom *= n
+        return denom
+    return np.power(n, d)
+
+
+# H(d,R) values shared by every HarmonicScaling instance
+_HARMONIC_CACHE: Dict[Tuple[float, int], float] = {}
+
+
 class HarmonicScaling:
     """Harmonic Scaling Law H(d,R) for entropy modulation"""
     
     def __init__(self, d: float = 2.0, R: int = 1000):
         self.d = d
         self.R = R
-        self._cache = {}
     
     def compute(self) -> float:
         """Compute H(d,R) = sum(1/n^d for n in 1..R)"""
         key = (self.d, self.R)
-        if key not in self._cache:
-            self._cache[key] = sum(1.0 / (n ** self.d) for n in range(1, self.R + 1))
-        return self._cache[key]
+        if key not in _HARMONIC_CACHE:
+            if _harmonic_sum is not None and self.R >= _NUMBA_MIN_R:
+                _HARMONIC_CACHE[key] = float(_harmonic_sum(float(self.d), int(self.R)))
+            else:
+                n = np.arange(1, self.R + 1, dtype=np.float64)
+                _HARMONIC_CACHE[key] = float(np.reciprocal(_powers(n, self.d)).sum())
+        return _HARMONIC_CACHE[key]
     
     def modulate_entropy(self, base_entropy: float) -> float:
         """Apply harmonic modulation to entropy"""
@@ -73,28 +120,96 @@ class HarmonicScaling:
         return base_entropy * (1 + h / self.R)
 
 
+# Warm the shared cache with the H(2,1000) default used by KyberKEM and PQCModule
+HarmonicScaling().compute()
+
+
+# liboqs mechanism names, tried in order (newer liboqs only ships ML-KEM/ML-DSA)
+_OQS_KEM_NAMES = ('Kyber1024', 'ML-KEM-1024')
+_OQS_SIG_NAMES = ('Dilithium5', 'ML-DSA-87')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_oqs():
+    """Import the optional liboqs bindings, or return None if they are unusable"""
+    if importlib.util.find_spec('oqs') is None:
+        return None
+    try:
+        import oqs
+    except (ImportError, RuntimeError, OSError):  # bindings installed without liboqs
+        return None
+    return oqs
+
+
+def _select_backend(backend: Optional[str], candidates: Tuple[str, ...],
+                    signature: bool = False) -> Tuple[str, Optional[str]]:
+    """Resolve a backend choice to ('oqs', mechanism) or ('sim', None)"""
+    if backend not in (None, 'oqs', 'sim'):
+        raise ValueError(f'Unknown PQC backend: {backend!r}')
+    if backend == 'sim':
+        return 'sim', None
+    oqs = _load_oqs()
+    mechanism = None
+    if oqs is not None:
+        enabled = (oqs.get_enabled_sig_mechanisms() if signature
+                   else oqs.get_enabled_kem_mechanisms())
+        mechanism = next((name for name in candidates if name in enabled), None)
+    if mechanism is None:
+        if backend == 'oqs':
+            raise ValueError('liboqs backend requested but no usable oqs bindings were found')
+        return 'sim', None
+    return 'oqs', mechanism
+
+
 class KyberKEM:
-    """Kyber Key Encapsulation Mechanism (Simulated)
+    """Kyber Key Encapsulation Mechanism
     
-    Production: Use pqcrypto or liboqs bindings
+    Backed by liboqs when the optional ``oqs`` bindings are installed;
+    falls back to a SHAKE-based simulation (``backend='sim'``) otherwise.
+    Call ``close()`` to release the liboqs context early.
     """
     
-    # Kyber-1024 parameters
+    # Kyber-1024 parameters used by the simulation; with liboqs the
+    # instance sizes are read from the selected mechanism
     PK_SIZE = 1568  # Public key size in bytes
     SK_SIZE = 3168  # Secret key size in bytes
     CT_SIZE = 1568  # Ciphertext size in bytes
     SS_SIZE = 32    # Shared secret size in bytes
     
-    def __init__(self, security_level: SecurityLevel = SecurityLevel.LEVEL_5):
+    def __init__(self, security_level: SecurityLevel = SecurityLevel.LEVEL_5,
+                 backend: Optional[str] = None):
         self.security_level = security_level
         self.harmonic = HarmonicScaling(d=2.0, R=1000)
+        # Encapsulation needs no secret key, so one liboqs context serves every call
+        self._encapsulator = None
+        self.backend, self._oqs_alg = _select_backend(backend, _OQS_KEM_NAMES)
+        if self.backend == 'oqs':
+            self._encapsulator = _load_oqs().KeyEncapsulation(self._oqs_alg)
+            details = self._encapsulator.details
+            self.PK_SIZE = details['length_public_key']
+            self.SK_SIZE = details['length_secret_key']
+            self.CT_SIZE = details['length_ciphertext']
+            self.SS_SIZE = details['length_shared_secret']
+    
+    def close(self):
+        """Release the cached liboqs encapsulation context, if any"""
+        if self._encapsulator is not None:
+            self._encapsulator.free()
+            self._encapsulator = None
+    
+    def __del__(self):
+        if getattr(self, '_encapsulator', None) is not None:
+            self.close()
     
     def keygen(self) -> Tuple[KyberPublicKey, KyberPrivateKey]:
         """Generate Kyber keypair"""
-        # Simulated keygen - use pqcrypto.kem.kyber1024 in production
-        seed = secrets.token_bytes(64)
-        pk_bytes = self._derive_public_key(seed)
-        sk_bytes = self._derive_secret_key(seed)
+        if self.backend == 'oqs':
+            with _load_oqs().KeyEncapsulation(self._oqs_alg) as kem:
+                pk_bytes = kem.generate_keypair()
+                sk_bytes = kem.export_secret_key()
+        else:
+            seed = secrets.token_bytes(64)
+            pk_bytes, sk_bytes = self._derive_keypair(seed)
         
         return (
             KyberPublicKey(pk_bytes, self.security_level),
@@ -103,6 +218,12 @@ class KyberKEM:
     
     def encapsulate(self, pk: KyberPublicKey) -> Tuple[bytes, bytes]:
         """Encapsulate: returns (ciphertext, shared_secret)"""
+        if self.backend == 'oqs':
+            if self._encapsulator is None:
+                self._encapsulator = _load_oqs().KeyEncapsulation(self._oqs_alg)
+            ct, ss = self._encapsulator.encap_secret(pk.pk_bytes)
+            return ct, ss
+        
         # Generate random coins with harmonic modulation
         coins = secrets.token_bytes(32)
         h_entropy = self.harmonic.modulate_entropy(len(coins) * 8)
@@ -115,17 +236,21 @@ class KyberKEM:
     
     def decapsulate(self, sk: KyberPrivateKey, ct: bytes) -> bytes:
         """Decapsulate: returns shared_secret"""
+        if self.backend == 'oqs':
+            with _load_oqs().KeyEncapsulation(self._oqs_alg, sk.sk_bytes) as kem:
+                return kem.decap_secret(ct)
+        
         # Derive shared secret from ciphertext
         ss = self._kyber_dec(sk.sk_bytes, ct)
         return ss
     
-    def _derive_public_key(self, seed: bytes) -> bytes:
-        """Derive public key from seed (simulated)"""
-        return hashlib.shake_256(b'kyber_pk' + seed).digest(self.PK_SIZE)
-    
-    def _derive_secret_key(self, seed: bytes) -> bytes:
-        """Derive secret key from seed (simulated)"""
-        return hashlib.shake_256(b'kyber_sk' + seed).digest(self.SK_SIZE)
+    def _derive_keypair(self, seed: bytes) -> Tuple[bytes, bytes]:
+        """Derive public and secret key from seed in one batch (simulated)"""
+        pk_bytes, sk_bytes = shake_256_batch(
+            [b'kyber_pk' + seed, b'kyber_sk' + seed],
+            [self.PK_SIZE, self.SK_SIZE],
+        )
+        return pk_bytes, sk_bytes
     
     def _kyber_enc(self, pk: bytes, coins: bytes) -> bytes:
         """Kyber encryption (simulated)"""
@@ -136,25 +261,70 @@ class KyberKEM:
         return hashlib.sha3_256(sk[:32] + ct[:32]).digest()
 
 
+# Longest message whose simulated verification digest is memoized
+_VERIFY_CACHE_MAX_MESSAGE = 1 << 12
+
+
+def _verify_digest(pk_prefix: bytes, message: bytes) -> bytes:
+    """Simulated Dilithium verification digest"""
+    return hashlib.shake_256(b'dilithium_verify' + pk_prefix + message).digest(64)
+
+
+@functools.lru_cache(maxsize=4096)
+def _dilithium_expected(pk_prefix: bytes, message: bytes) -> bytes:
+    """_verify_digest, memoized per (pk, message)"""
+    return _verify_digest(pk_prefix, message)
+
+
 class DilithiumSign:
-    """Dilithium Digital Signature Scheme (Simulated)
+    """Dilithium Digital Signature Scheme
     
-    Production: Use pqcrypto or liboqs bindings
+    Backed by liboqs when the optional ``oqs`` bindings are installed;
+    falls back to a SHAKE-based simulation (``backend='sim'``) otherwise.
+    Call ``close()`` to release the liboqs context early.
     """
     
-    # Dilithium5 parameters
+    # Simulation sizes; with liboqs the instance sizes are read from the
+    # selected mechanism (Dilithium5 and ML-DSA-87 differ in sk and sig)
     PK_SIZE = 2592
     SK_SIZE = 4864
     SIG_SIZE = 4627
     
-    def __init__(self, security_level: SecurityLevel = SecurityLevel.LEVEL_5):
+    def __init__(self, security_level: SecurityLevel = SecurityLevel.LEVEL_5,
+                 backend: Optional[str] = None):
         self.security_level = security_level
+        # Verification needs no secret key, so one liboqs context serves every call
+        self._verifier = None
+        self.backend, self._oqs_alg = _select_backend(backend, _OQS_SIG_NAMES, signature=True)
+        if self.backend == 'oqs':
+            self._verifier = _load_oqs().Signature(self._oqs_alg)
+            details = self._verifier.details
+            self.PK_SIZE = details['length_public_key']
+            self.SK_SIZE = details['length_secret_key']
+            self.SIG_SIZE = details['length_signature']
+    
+    def close(self):
+        """Release the cached liboqs verification context, if any"""
+        if self._verifier is not None:
+            self._verifier.free()
+            self._verifier = None
+    
+    def __del__(self):
+        if getattr(self, '_verifier', None) is not None:
+            self.close()
     
     def keygen(self) -> Tuple[DilithiumPublicKey, DilithiumPrivateKey]:
         """Generate Dilithium keypair"""
-        seed = secrets.token_bytes(64)
-        pk_bytes = hashlib.shake_256(b'dilithium_pk' + seed).digest(self.PK_SIZE)
-        sk_bytes = hashlib.shake_256(b'dilithium_sk' + seed).digest(self.SK_SIZE)
+        if self.backend == 'oqs':
+            with _load_oqs().Signature(self._oqs_alg) as signer:
+                pk_bytes = signer.generate_keypair()
+                sk_bytes = signer.export_secret_key()
+        else:
+            seed = secrets.token_bytes(64)
+            pk_bytes, sk_bytes = shake_256_batch(
+                [b'dilithium_pk' + seed, b'dilithium_sk' + seed],
+                [self.PK_SIZE, self.SK_SIZE],
+            )
         
         return (
             DilithiumPublicKey(pk_bytes, self.security_level),
@@ -163,12 +333,22 @@ class DilithiumSign:
     
     def sign(self, sk: DilithiumPrivateKey, message: bytes) -> bytes:
         """Sign a message"""
+        if self.backend == 'oqs':
+            with _load_oqs().Signature(self._oqs_alg, sk.sk_bytes) as signer:
+                return signer.sign(message)
         sig = hashlib.shake_256(b'dilithium_sig' + sk.sk_bytes + message).digest(self.SIG_SIZE)
         return sig
     
     def verify(self, pk: DilithiumPublicKey, message: bytes, signature: bytes) -> bool:
         """Verify a signature"""
-        expected = hashlib.shake_256(b'dilithium_verify' + pk.pk_bytes[:64] + message).digest(64)
+        if self.backend == 'oqs':
+            if self._verifier is None:
+                self._verifier = _load_oqs().Signature(self._oqs_alg)
+            return self._verifier.verify(message, signature, pk.pk_bytes)
+        if len(message) <= _VERIFY_CACHE_MAX_MESSAGE:
+            expected = _dilithium_expected(pk.pk_bytes[:64], bytes(message))
+        else:
+            expected = _verify_digest(pk.pk_bytes[:64], message)
         return secrets.compare_digest(signature[:64], expected)
 
 
@@ -179,11 +359,12 @@ class PQCModule:
     Harmonic Scaling Law integration.
     """
     
-    def __init__(self, security_level: SecurityLevel = SecurityLevel.LEVEL_5):
+    def __init__(self, security_level: SecurityLevel = SecurityLevel.LEVEL_5,
+                 backend: Optional[str] = None):
         self.security_level = security_level
-        self.kem = KyberKEM(security_level)
-        self.sig = DilithiumSign(security_level)
-        self.harmonic = HarmonicScaling(d=2.0, R=1000)
+        self.kem = KyberKEM(security_level, backend)
+        self.sig = DilithiumSign(security_level, backend)
+        self.harmonic = self.kem.harmonic
     
     def generate_kem_keypair(self) -> Tuple[KyberPublicKey, KyberPrivateKey]:
         """Generate Kyber keypair for key encapsulation"""
@@ -212,6 +393,11 @@ class PQCModule:
     def get_harmonic_coefficient(self) -> float:
         """Get current harmonic scaling coefficient"""
         return self.harmonic.compute()
+    
+    def close(self):
+        """Release liboqs contexts held by the KEM and signature schemes"""
+        self.kem.close()
+        self.sig.close()
 
 
 # Example usage
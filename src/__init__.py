@@ -12,8 +12,6 @@ __author__ = "Isaac Davis"
 __email__ = "issdandavis@github.com"
 
 from src.scbe_engine import SCBEEngine, encrypt, decrypt
-from src.harmonic_crypto import HarmonicScaling, compute_hdr
-from src.aethermoore import AetherMooreProtocol
 
 __all__ = [
     "__version__",
@@ -21,7 +19,4 @@ __all__ = [
     "SCBEEngine",
     "encrypt",
     "decrypt",
-    "HarmonicScaling",
-    "compute_hdr",
-    "AetherMooreProtocol",
 ]
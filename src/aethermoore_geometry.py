@@ -10,12 +10,33 @@ Mathematical Foundation:
 - Mobius Transformations for key rotations
 """
 
+import functools
 import math
 import cmath
+import os
 from typing import Tuple, List, Optional
 from dataclasses import dataclass
 import hashlib
-import struct
+
+import numpy as np
+
+def _traverse_tile_from_env(default: int = 4096) -> int:
+    """SPIRALVERSE_TRAVERSE_TILE as a positive int, or default if unset or malformed."""
+    try:
+        return max(1, int(os.environ.get('SPIRALVERSE_TRAVERSE_TILE', default)))
+    except ValueError:
+        return default
+
+
+# Points per tile in traverse_layers_batch (4096 complex128 = 64 KiB);
+# override with SPIRALVERSE_TRAVERSE_TILE to tune for a given cache size
+_TRAVERSE_TILE = _traverse_tile_from_env()
+
+
+def _u64_to_unit(b: bytes) -> float:
+    """Map 8 big-endian bytes uniformly onto [0, 1)."""
+    # Keep the top 53 bits so the product is exact and never rounds up to 1.0
+    return (int.from_bytes(b[:8], 'big') >> 11) * (1.0 / (1 << 53))
 
 
 @dataclass
@@ -28,6 +49,13 @@ class HyperbolicPoint:
             # Normalize to disk boundary
             self.z = self.z / (abs(self.z) + 1e-10) * 0.9999
     
+    @classmethod
+    def _unsafe(cls, z: complex) -> 'HyperbolicPoint':
+        """Wrap a point already known to lie inside the disk, skipping checks."""
+        point = object.__new__(cls)
+        point.z = z
+        return point
+    
     @property
     def radius(self) -> float:
         return abs(self.z)
@@ -53,18 +81,32 @@ class PoincareTransform:
             return complex(0.9999, 0)
         result = (self.a * z + self.b) / denominator
         # Ensure result stays in disk
-        if abs(result) >= 1:
-            result = result / (abs(result) + 1e-10) * 0.9999
+        radius = abs(result)
+        if radius >= 1:
+            result = result / (radius + 1e-10) * 0.9999
         return result
     
+    def apply_fast(self, z):
+        """Apply (az + b) / (cz + d) without the denominator and disk guards.
+        
+        Only valid for transforms that map the disk into itself, such as
+        the disk automorphisms used for geodesic interpolation. Accepts a
+        complex scalar or a NumPy array of points.
+        """
+        return (self.a * z + self.b) / (self.c * z + self.d)
+    
     @classmethod
     def from_key(cls, key: bytes) -> 'PoincareTransform':
         """Generate transformation from cryptographic key."""
-        h = hashlib.sha512(key).digest()
+        return cls._from_hash_bytes(hashlib.sha512(key).digest())
+    
+    @classmethod
+    def _from_hash_bytes(cls, h: bytes) -> 'PoincareTransform':
+        """Build transformation from 64 uniformly random bytes."""
         # Extract 4 complex numbers from hash
         def bytes_to_complex(b: bytes) -> complex:
-            r = struct.unpack('>d', b[:8])[0] % 1.0
-            i = struct.unpack('>d', b[8:16])[0] % 1.0
+            r = _u64_to_unit(b[:8])
+            i = _u64_to_unit(b[8:16])
             return complex(r * 0.5, i * 0.5)
         
         a = bytes_to_complex(h[0:16])
@@ -84,21 +126,25 @@ class HyperbolicSpace:
     """13-Layer Hyperbolic Security Space."""
     
     PHI = (1 + math.sqrt(5)) / 2  # Golden ratio
-    LAYER_CURVATURES = [-1 / (PHI ** i) for i in range(13)]
+    LAYER_CURVATURES = -1 / PHI ** np.arange(13, dtype=np.float64)
+    # Per-layer radial scaling applied before each Mobius transform
+    _CURV_SCALE = 1 + LAYER_CURVATURES * 0.1
     
     def __init__(self, master_key: bytes):
         self.master_key = master_key
         self.layer_transforms = self._generate_layer_transforms()
+        # Per-layer Mobius coefficients and curvature scaling for batch traversal
+        self._A = np.array([t.a for t in self.layer_transforms], dtype=np.complex128)
+        self._B = np.array([t.b for t in self.layer_transforms], dtype=np.complex128)
+        self._C = np.array([t.c for t in self.layer_transforms], dtype=np.complex128)
+        self._D = np.array([t.d for t in self.layer_transforms], dtype=np.complex128)
     
     def _generate_layer_transforms(self) -> List[PoincareTransform]:
         """Generate unique transform for each security layer."""
-        transforms = []
-        for i in range(13):
-            layer_key = hashlib.sha256(
-                self.master_key + i.to_bytes(1, 'big')
-            ).digest()
-            transforms.append(PoincareTransform.from_key(layer_key))
-        return transforms
+        # One XOF call yields 64 bytes of Mobius parameters per layer
+        buf = hashlib.shake_256(self.master_key).digest(13 * 64)
+        return [PoincareTransform._from_hash_bytes(buf[i * 64:(i + 1) * 64])
+                for i in range(13)]
     
     def hyperbolic_distance(self, z1: complex, z2: complex) -> float:
         """Calculate hyperbolic distance in Poincare disk."""
@@ -111,41 +157,49 @@ class HyperbolicSpace:
             ratio = 0.9999
         return 2 * math.atanh(ratio)
     
+    def _batch_hdist(self, z1: np.ndarray, z2: np.ndarray) -> np.ndarray:
+        """Elementwise hyperbolic_distance over complex arrays."""
+        numerator = np.abs(z1 - z2)
+        denominator = np.abs(1 - np.conj(z1) * z2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = numerator / denominator
+        ratio = np.where(ratio >= 1, 0.9999, ratio)
+        return np.where(denominator < 1e-15, np.inf, 2 * np.arctanh(ratio))
+    
     def geodesic_path(self, start: complex, end: complex, 
                       steps: int = 100) -> List[complex]:
         """Generate points along hyperbolic geodesic."""
-        path = []
-        for t in range(steps + 1):
-            alpha = t / steps
-            # Weighted hyperbolic midpoint
-            point = self._hyperbolic_interpolate(start, end, alpha)
-            path.append(point)
-        return path
-    
-    def _hyperbolic_interpolate(self, z1: complex, z2: complex, 
-                                 t: float) -> complex:
-        """Interpolate along hyperbolic geodesic."""
-        # Transform to origin-centered geodesic
+        if steps < 1:
+            raise ValueError(f'steps must be at least 1, got {steps}')
+        t = np.arange(steps + 1) / steps
+        return self._hyperbolic_interpolate_vec(start, end, t).tolist()
+    
+    def _hyperbolic_interpolate_vec(self, z1: complex, z2: complex, 
+                                    t: np.ndarray) -> np.ndarray:
+        """Interpolate along hyperbolic geodesic at every fraction in t."""
+        # Transform to origin-centered geodesic (identical for every t)
         transform = PoincareTransform(1, -z1, -z1.conjugate(), 1)
         z2_transformed = transform.apply(z2)
         
         # Interpolate along radius
         r = abs(z2_transformed)
         theta = cmath.phase(z2_transformed)
-        r_interp = math.tanh(t * math.atanh(r))
-        z_interp = complex(r_interp * math.cos(theta), 
-                          r_interp * math.sin(theta))
+        r_interp = np.tanh(t * math.atanh(r))
+        z_interp = r_interp * math.cos(theta) + 1j * (r_interp * math.sin(theta))
         
-        # Transform back
+        # Transform back; inside the disk the inverse is a disk automorphism
+        # and needs no guards, so it can run on the whole array
         inverse = PoincareTransform(1, z1, z1.conjugate(), 1)
-        return inverse.apply(z_interp)
+        if abs(z1) < 1:
+            return inverse.apply_fast(z_interp)
+        return np.array([inverse.apply(z) for z in z_interp.tolist()], dtype=np.complex128)
     
     def encode_point(self, data: bytes) -> HyperbolicPoint:
         """Encode data as point in hyperbolic space."""
         h = hashlib.sha256(data).digest()
         # Map to unit disk
-        x = struct.unpack('>d', h[:8])[0] % 1.0 - 0.5
-        y = struct.unpack('>d', h[8:16])[0] % 1.0 - 0.5
+        x = _u64_to_unit(h[:8]) - 0.5
+        y = _u64_to_unit(h[8:16]) - 0.5
         z = complex(x, y)
         # Ensure inside disk
         if abs(z) >= 1:
@@ -154,32 +208,58 @@ class HyperbolicSpace:
     
     def traverse_layers(self, point: HyperbolicPoint) -> List[HyperbolicPoint]:
         """Transform point through all 13 security layers."""
-        current = point.z
-        trajectory = [HyperbolicPoint(current)]
+        trajectory = self.traverse_layers_batch(np.array([point.z]))[0]
+        # Inputs are HyperbolicPoints and every layer output is clipped already
+        return [HyperbolicPoint._unsafe(z) for z in trajectory.tolist()]
+    
+    def traverse_layers_batch(self, points: np.ndarray) -> np.ndarray:
+        """Transform N points through all 13 layers at once.
         
-        for i, transform in enumerate(self.layer_transforms):
+        Returns an (N, 14) complex array: each row is the input point
+        followed by its position after every layer.
+        """
+        z = np.asarray(points, dtype=np.complex128)
+        trajectories = np.empty((z.shape[0], len(self._A) + 1), dtype=np.complex128)
+        # Run all layers on one cache-sized tile before moving to the next
+        for k in range(0, z.shape[0], _TRAVERSE_TILE):
+            self._traverse_tile(z[k:k + _TRAVERSE_TILE], trajectories[k:k + _TRAVERSE_TILE])
+        return trajectories
+    
+    def _traverse_tile(self, z: np.ndarray, out: np.ndarray):
+        """Fill ``out`` with the 14-point trajectories of the points ``z``."""
+        out[:, 0] = z
+        for i in range(len(self._A)):
             # Apply layer-specific curvature scaling
-            curvature = self.LAYER_CURVATURES[i]
-            scaled = current * (1 + curvature * 0.1)
-            # Apply Mobius transformation
-            current = transform.apply(scaled)
-            trajectory.append(HyperbolicPoint(current))
-        
-        return trajectory
+            scaled = z * self._CURV_SCALE[i]
+            # Apply Mobius transformation, with the same guards as apply()
+            denominator = self._C[i] * scaled + self._D[i]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                z = (self._A[i] * scaled + self._B[i]) / denominator
+                radius = np.abs(z)
+                z = np.where(radius >= 1, z / (radius + 1e-10) * 0.9999, z)
+            z = np.where(np.abs(denominator) < 1e-15, complex(0.9999, 0), z)
+            out[:, i + 1] = z
     
     def compute_security_hash(self, data: bytes) -> bytes:
         """Generate security hash via hyperbolic trajectory."""
         point = self.encode_point(data)
-        trajectory = self.traverse_layers(point)
-        
-        # Combine trajectory points into hash
-        combined = b''
-        for p in trajectory:
-            real_bytes = struct.pack('>d', p.z.real)
-            imag_bytes = struct.pack('>d', p.z.imag)
-            combined += real_bytes + imag_bytes
+        trajectory = self.traverse_layers_batch(np.array([point.z]))[0]
         
-        return hashlib.sha512(combined).digest()
+        # Big-endian (real, imag) doubles per point, packed in one copy
+        return hashlib.sha512(trajectory.astype('>c16').tobytes()).digest()
+
+
+@functools.lru_cache(maxsize=16)
+def _golden_spiral(n: int) -> np.ndarray:
+    """Complex coordinates of the first n golden spiral points."""
+    i = np.arange(n, dtype=np.float64)
+    # Golden angle in radians
+    theta = 2 * math.pi * i / (HyperbolicSpace.PHI ** 2)
+    # Radius follows Fibonacci spiral
+    r = 0.9 * (1 - 1 / (1 + i * 0.1))
+    z = r * np.cos(theta) + 1j * (r * np.sin(theta))
+    z.setflags(write=False)
+    return z
 
 
 class SpiralverseGeometry:
@@ -190,18 +270,8 @@ class SpiralverseGeometry:
     
     def golden_spiral_points(self, n: int) -> List[HyperbolicPoint]:
         """Generate n points along golden spiral in hyperbolic space."""
-        phi = HyperbolicSpace.PHI
-        points = []
-        
-        for i in range(n):
-            # Golden angle in radians
-            theta = 2 * math.pi * i / (phi ** 2)
-            # Radius follows Fibonacci spiral
-            r = 0.9 * (1 - 1 / (1 + i * 0.1))
-            z = complex(r * math.cos(theta), r * math.sin(theta))
-            points.append(HyperbolicPoint(z))
-        
-        return points
+        # Spiral radii stay below 0.9, so no normalization is needed
+        return [HyperbolicPoint._unsafe(z) for z in _golden_spiral(n).tolist()]
     
     def verify_trajectory_integrity(self, 
                                     trajectory: List[HyperbolicPoint]) -> bool:
@@ -210,15 +280,11 @@ class SpiralverseGeometry:
             return False
         
         # Check monotonic distance increase from origin
-        distances = [self.space.hyperbolic_distance(complex(0, 0), p.z) 
-                    for p in trajectory]
-        
-        # Allow small numerical tolerance
-        for i in range(1, len(distances)):
-            if distances[i] < distances[i-1] - 0.01:
-                return False
+        z = np.array([p.z for p in trajectory], dtype=np.complex128)
+        distances = self.space._batch_hdist(np.zeros_like(z), z)
         
-        return True
+        # Allow small numerical tolerance (NaN/inf comparisons behave as before)
+        return not np.any(distances[1:] < distances[:-1] - 0.01)
 
 
 if __name__ == '__main__':
@@ -11,13 +11,22 @@ Where:
 - delta(c_i): Contextual modifier based on position
 """
 
+import functools
 import math
 import hashlib
+import hmac
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 import struct
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speedup
+    njit = None
+
 
 class HebrewLetter(Enum):
     """Hebrew letter gematria values."""
@@ -75,15 +84,61 @@ class LWSToken:
         return self.base_weight * phonetic_factor * self.context_modifier
 
 
+if njit is not None:
+    @njit(cache=True)
+    def _gematria_kernel(text, base, digraphs):
+        """compute_gematria over UTF-8 bytes with ASCII lookup tables"""
+        total = 0
+        n = text.shape[0]
+        i = 0
+        while i < n:
+            c = text[i]
+            if c < 128 and i + 1 < n:
+                c2 = text[i + 1]
+                if c2 < 128 and digraphs[c, c2] >= 0:
+                    total += digraphs[c, c2]
+                    i += 2
+                    continue
+            if c < 128:
+                total += base[c]
+            i += 1
+        return total
+else:
+    _gematria_kernel = None
+
+
+@functools.lru_cache(maxsize=32)
+def _context_table(size: int) -> np.ndarray:
+    """Contextual modifiers delta(c_i) for positions 0..size-1.
+    
+    Built with math.sin so the values, and every hash that depends on
+    them, match the scalar formula bit for bit.
+    """
+    phi = LWSEngine.PHI
+    table = np.array([1.0 + 0.1 * math.sin(position * phi) for position in range(size)])
+    table.setflags(write=False)
+    return table
+
+
+def _context_modifiers(n: int) -> np.ndarray:
+    """First n contextual modifiers, served from a power-of-two table"""
+    return _context_table(1 << max(n - 1, 0).bit_length())[:n]
+
+
 class LWSEngine:
     """Langues Weighting System computational engine."""
     
     PHI = (1 + math.sqrt(5)) / 2  # Golden ratio
     SACRED_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+    _SACRED_PRIMES = np.array(SACRED_PRIMES, dtype=np.int32)
+    # Phonetic features of letters missing from the phonetic map
+    DEFAULT_PHONETIC = PhoneticVector(0.5, 0.5, 0.5, 0.0)
     
     def __init__(self):
         self.gematria_map = self._build_gematria_map()
         self.phonetic_map = self._build_phonetic_map()
+        self._gematria_tables = self._build_gematria_tables()
+        self._token_tables = self._build_token_tables()
     
     def _build_gematria_map(self) -> Dict[str, int]:
         """Build Hebrew-to-Latin phonetic gematria mapping."""
@@ -113,6 +168,22 @@ class LWSEngine:
             'e': 5, 'u': 6
         }
     
+    def _build_gematria_tables(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """ASCII-indexed letter and digraph values for the JIT kernel.
+        
+        Returns None when the map has keys the tables cannot represent.
+        """
+        if not all(key.isascii() and len(key) <= 2 for key in self.gematria_map):
+            return None
+        base = np.zeros(128, dtype=np.int32)
+        digraphs = np.full((128, 128), -1, dtype=np.int32)
+        for key, value in self.gematria_map.items():
+            if len(key) == 1:
+                base[ord(key)] = value
+            else:
+                digraphs[ord(key[0]), ord(key[1])] = value
+        return base, digraphs
+    
     def _build_phonetic_map(self) -> Dict[str, PhoneticVector]:
         """Build phonetic feature vectors for letters."""
         return {
@@ -141,9 +212,39 @@ class LWSEngine:
             'z': PhoneticVector(1.0, 0.3, 0.4, 0.0),
         }
     
+    def _build_token_tables(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ASCII-indexed base weights, phonetic rows and phonetic factors.
+        
+        Unmapped entries hold the tokenize defaults; non-ASCII letters are
+        looked up in the maps directly.
+        """
+        base = np.ones(128, dtype=np.float64)
+        phonetic = np.tile(self.DEFAULT_PHONETIC.to_array(), (128, 1))
+        for key, value in self.gematria_map.items():
+            if len(key) == 1 and key.isascii():
+                base[ord(key)] = value
+        for key, vector in self.phonetic_map.items():
+            if len(key) == 1 and key.isascii():
+                phonetic[ord(key)] = vector.to_array()
+        factor = np.array([self._phonetic_factor(row) for row in phonetic.tolist()])
+        return base, phonetic, factor
+    
+    @staticmethod
+    def _phonetic_factor(row: List[float]) -> float:
+        """LWSToken.computed_weight's phonetic factor for one phonetic row.
+        
+        Uses builtin sum, whose rounding (compensated since Python 3.12)
+        has to match the per-token formula exactly.
+        """
+        return sum(row) / 4.0
+    
     def compute_gematria(self, text: str) -> int:
         """Compute total gematria value of text."""
         text = text.lower()
+        if _gematria_kernel is not None and self._gematria_tables is not None:
+            # Non-ASCII characters never match, so scanning UTF-8 bytes is exact
+            data = np.frombuffer(text.encode('utf-8', 'surrogatepass'), dtype=np.uint8)
+            return int(_gematria_kernel(data, *self._gematria_tables))
         total = 0
         i = 0
         while i < len(text):
@@ -160,26 +261,75 @@ class LWSEngine:
     
     def tokenize(self, text: str) -> List[LWSToken]:
         """Tokenize text into weighted LWS tokens."""
-        text = text.lower()
-        tokens = []
-        position = 0
-        for i, char in enumerate(text):
-            if char.isalpha():
-                base = self.gematria_map.get(char, 1)
-                phonetic = self.phonetic_map.get(char, PhoneticVector(0.5, 0.5, 0.5, 0.0))
-                context = 1.0 + 0.1 * math.sin(position * self.PHI)
-                tokens.append(LWSToken(symbol=char, base_weight=float(base), phonetic=phonetic, position=position, context_modifier=context))
-                position += 1
-        return tokens
+        soa = self._tokenize_soa(text)
+        columns = zip(soa['symbols'], soa['base'].tolist(),
+                      soa['phonetic'].tolist(), soa['context'].tolist())
+        return [
+            LWSToken(symbol=char, base_weight=base, phonetic=PhoneticVector(*phonetic),
+                     position=position, context_modifier=context)
+            for position, (char, base, phonetic, context) in enumerate(columns)
+        ]
+    
+    def _tokenize_soa(self, text: str) -> Dict[str, np.ndarray]:
+        """Tokenize text into parallel per-token arrays (struct of arrays).
+        
+        Keys: ``symbols`` (list of letters), ``base`` (N,), ``phonetic``
+        (N, 4), ``phonetic_factor`` (N,), ``position`` (N,) and ``context`` (N,).
+        """
+        symbols = [char for char in text.lower() if char.isalpha()]
+        n = len(symbols)
+        codes = np.fromiter(map(ord, symbols), dtype=np.int64, count=n)
+        ascii_mask = codes < 128
+        index = np.where(ascii_mask, codes, 0)
+        base_table, phonetic_table, factor_table = self._token_tables
+        base = base_table[index]
+        phonetic = phonetic_table[index]
+        factor = factor_table[index]
+        for i in np.flatnonzero(~ascii_mask).tolist():
+            char = symbols[i]
+            base[i] = self.gematria_map.get(char, 1)
+            phonetic[i] = self.phonetic_map.get(char, self.DEFAULT_PHONETIC).to_array()
+            factor[i] = self._phonetic_factor(phonetic[i].tolist())
+        return {
+            'symbols': symbols,
+            'base': base,
+            'phonetic': phonetic,
+            'phonetic_factor': factor,
+            'position': np.arange(n),
+            'context': _context_modifiers(n),
+        }
     
     def sacred_hash(self, text: str) -> bytes:
         """Generate sacred geometry-bound hash."""
-        tokens = self.tokenize(text)
-        combined = sum(t.computed_weight * self.SACRED_PRIMES[i % len(self.SACRED_PRIMES)] for i, t in enumerate(tokens))
+        soa = self._tokenize_soa(text)
+        # Same operation order as LWSToken.computed_weight, and the final
+        # reduction stays on builtin sum: its float rounding changed in
+        # Python 3.12 and the digest must match the per-token formula there
+        weights = soa['base'] * soa['phonetic_factor'] * soa['context']
+        primes = self._SACRED_PRIMES
+        terms = weights * primes[soa['position'] % len(primes)]
+        combined = sum(terms.tolist())
         combined *= (self.compute_gematria(text) / 1000.0 + 1)
         return hashlib.sha256(struct.pack('>d', combined) + text.encode()).digest()
 
 
+class LWSCryptoBinding:
+    """Binds keys and signatures to the LWS weighting of text."""
+    
+    def __init__(self, engine: Optional[LWSEngine] = None):
+        self.engine = engine or LWSEngine()
+    
+    def derive_key(self, passphrase: str) -> bytes:
+        """Derive a 32-byte semantic key from a passphrase."""
+        sacred = self.engine.sacred_hash(passphrase)
+        return hashlib.sha3_256(b'LWS-KEY' + sacred + passphrase.encode()).digest()
+    
+    def semantic_signature(self, text: str, key: bytes) -> bytes:
+        """Keyed 64-byte signature over the sacred hash of text."""
+        sacred = self.engine.sacred_hash(text)
+        return hmac.new(key, sacred + text.encode(), hashlib.sha3_512).digest()
+
+
 if __name__ == '__main__':
     engine = LWSEngine()
     test_text = 'AetherMoore Quantum Sacred'
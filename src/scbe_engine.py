@@ -7,11 +7,21 @@ Core encryption/decryption module implementing:
 """
 
 import hashlib
+import hmac
 import secrets
-from typing import Tuple, Optional
+from typing import List, Sequence, Tuple, Optional, Union, overload
 from dataclasses import dataclass
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speedup
+    njit = None
+
+
+# HMAC-SHA3-256 tag appended to every ciphertext
+_MAC_SIZE = 32
+
 
 @dataclass
 class SCBEConfig:
@@ -23,6 +33,29 @@ class SCBEConfig:
     harmonic_R: int = 1000
 
 
+if njit is not None:
+    # No fastmath: the keystream depends on every rounding step of the map
+    @njit('void(float64[::1], int64, float64)', cache=True)
+    def _chaos_advance(state, steps, r):
+        """Run ``steps`` logistic-map iterations on ``state`` in place"""
+        for _ in range(steps):
+            for j in range(state.shape[0]):
+                state[j] = r * state[j] * (1 - state[j])
+    
+    @njit('void(float64[::1], int64, float64, uint8[::1])', cache=True)
+    def _chaos_stream(state, steps, r, out):
+        """Iterate ``state`` in place, writing one byte per axis per step"""
+        axes = state.shape[0]
+        for i in range(steps):
+            for j in range(axes):
+                s = r * state[j] * (1 - state[j])
+                state[j] = s
+                out[i * axes + j] = int(s * 256) % 256
+else:
+    _chaos_advance = None
+    _chaos_stream = None
+
+
 class ChaosGenerator:
     """5-axis chaos generation using logistic map"""
     
@@ -44,14 +77,42 @@ class ChaosGenerator:
         self._state = r * self._state * (1 - self._state)
         return self._state.copy()
     
-    def generate_stream(self, length: int) -> bytes:
+    def advance(self, steps: int, r: float = 3.99):
+        """Run ``steps`` iterations without producing output"""
+        if _chaos_advance is not None:
+            _chaos_advance(self._state, steps, r)
+            return
+        for _ in range(steps):
+            self.iterate(r)
+    
+    def generate_stream(self, length: int, r: float = 3.99) -> bytes:
         """Generate chaotic byte stream"""
-        result = bytearray()
-        while len(result) < length:
-            self.iterate()
-            for val in self._state:
-                result.append(int(val * 256) % 256)
-        return bytes(result[:length])
+        # One 5-axis iteration per 5 bytes; the tail of the last one is dropped
+        return self._iterate_bytes(-(-length // 5), r)[:length].tobytes()
+    
+    def generate_blocks(self, n_blocks: int, block_size: int,
+                        r: float = 3.99) -> np.ndarray:
+        """Streams of n_blocks successive generate_stream(block_size) calls
+        
+        Produced in one pass as an (n_blocks, block_size) uint8 array.
+        """
+        steps = -(-block_size // 5)
+        stream = self._iterate_bytes(n_blocks * steps, r)
+        return stream.reshape(n_blocks, steps * 5)[:, :block_size]
+    
+    def _iterate_bytes(self, steps: int, r: float) -> np.ndarray:
+        """Run ``steps`` iterations, returning one byte per axis per step"""
+        if _chaos_stream is not None:
+            out = np.empty(steps * 5, dtype=np.uint8)
+            _chaos_stream(self._state, steps, r, out)
+            return out
+        states = np.empty((steps, 5))
+        state = self._state
+        for i in range(steps):
+            state = r * state * (1 - state)
+            states[i] = state
+        self._state = state
+        return ((states * 256).astype(np.int64) % 256).astype(np.uint8).ravel()
 
 
 class SCBEEngine:
@@ -77,16 +138,49 @@ class SCBEEngine:
         
         # Chaos enhancement
         chaos = ChaosGenerator(initial)
-        for _ in range(self.config.chaos_iterations):
-            chaos.iterate()
+        chaos.advance(self.config.chaos_iterations)
         
         enhanced = chaos.generate_stream(32)
         final_key = hashlib.sha3_256(initial + enhanced).digest()
         
         return salt + final_key
     
-    def encrypt(self, plaintext: bytes, key: bytes) -> bytes:
-        """Encrypt data using SCBE"""
+    def ciphertext_size(self, plaintext_size: int) -> int:
+        """Length of the ciphertext encrypt produces for a plaintext size"""
+        bs = self.config.block_size
+        return bs + (plaintext_size // bs + 1) * bs + _MAC_SIZE
+    
+    @overload
+    def encrypt(self, plaintext: bytes, key: bytes, out: None = None) -> bytes: ...
+    @overload
+    def encrypt(self, plaintext: bytes, key: bytes, out: bytearray) -> memoryview: ...
+    
+    def encrypt(self, plaintext: bytes, key: bytes,
+                out: Optional[bytearray] = None) -> Union[bytes, memoryview]:
+        """Encrypt data using SCBE
+        
+        With ``out``, the ciphertext is written to the start of that buffer,
+        which must hold ``ciphertext_size(len(plaintext))`` bytes, and a
+        memoryview of it is returned.
+        """
+        # Extract salt and actual key
+        salt = key[:16]
+        actual_key = key[16:48]
+        
+        # Initialize chaos with key
+        self._chaos = ChaosGenerator(actual_key + salt)
+        
+        n_blocks = len(plaintext) // self.config.block_size + 1
+        return self._seal(plaintext, self._chaos_blocks(n_blocks),
+                          self._mac_key(actual_key, salt), out)
+    
+    def encrypt_many(self, plaintexts: Sequence[bytes], key: bytes) -> List[bytes]:
+        """Encrypt several plaintexts under one key
+        
+        Same result as calling encrypt on each, but the chaos stream only
+        depends on the key, so it is generated once for the longest
+        plaintext and every message uses a prefix of it.
+        """
         # Extract salt and actual key
         salt = key[:16]
         actual_key = key[16:48]
@@ -94,63 +188,132 @@ class SCBEEngine:
         # Initialize chaos with key
         self._chaos = ChaosGenerator(actual_key + salt)
         
+        bs = self.config.block_size
+        longest = max(map(len, plaintexts), default=-1)
+        stream = self._chaos_blocks(longest // bs + 1)
+        mac_key = self._mac_key(actual_key, salt)
+        return [self._seal(plaintext, stream[:len(plaintext) // bs + 1], mac_key)
+                for plaintext in plaintexts]
+    
+    @overload
+    def _seal(self, plaintext: bytes, stream: np.ndarray, mac_key: bytes,
+              out: None = None) -> bytes: ...
+    @overload
+    def _seal(self, plaintext: bytes, stream: np.ndarray, mac_key: bytes,
+              out: bytearray) -> memoryview: ...
+    
+    def _seal(self, plaintext: bytes, stream: np.ndarray, mac_key: bytes,
+              out: Optional[bytearray] = None) -> Union[bytes, memoryview]:
+        """Pad, chain and authenticate one plaintext with its chaos blocks"""
         # Generate IV
         iv = secrets.token_bytes(self.config.block_size)
         
-        # Encrypt blocks
-        ciphertext = bytearray()
-        prev_block = iv
-        
         # Pad plaintext
         padded = self._pad(plaintext)
+        bs = self.config.block_size
+        blocks = np.frombuffer(padded, dtype=np.uint8).reshape(-1, bs)
         
-        for i in range(0, len(padded), self.config.block_size):
-            block = padded[i:i + self.config.block_size]
-            # XOR with previous block (CBC-like)
-            xored = bytes(a ^ b for a, b in zip(block, prev_block))
-            # XOR with chaos stream
-            chaos_stream = self._chaos.generate_stream(self.config.block_size)
-            encrypted = bytes(a ^ b for a, b in zip(xored, chaos_stream))
-            ciphertext.extend(encrypted)
-            prev_block = encrypted
+        # XOR with chaos stream, then chain: c[i] = c[i-1] ^ p[i] ^ s[i] (CBC-like)
+        chained = blocks ^ stream
+        chained[0] ^= np.frombuffer(iv, dtype=np.uint8)
+        if out is None:
+            ciphertext = np.bitwise_xor.accumulate(chained, axis=0)
+            
+            # Encrypt-then-MAC over IV and ciphertext
+            body = iv + ciphertext.tobytes()
+            return body + self._mac(body, mac_key)
         
-        return iv + bytes(ciphertext)
+        # Same layout, assembled in the caller's buffer
+        body_size = bs + len(padded)
+        view = self._out_view(out, body_size + _MAC_SIZE)
+        view[:bs] = iv
+        np.bitwise_xor.accumulate(chained, axis=0, out=np.frombuffer(
+            view[bs:body_size], dtype=np.uint8).reshape(-1, bs))
+        view[body_size:] = self._mac(view[:body_size], mac_key)
+        return view
+    
+    @overload
+    def decrypt(self, ciphertext: bytes, key: bytes, out: None = None) -> bytes: ...
+    @overload
+    def decrypt(self, ciphertext: bytes, key: bytes, out: bytearray) -> memoryview: ...
     
-    def decrypt(self, ciphertext: bytes, key: bytes) -> bytes:
-        """Decrypt data using SCBE"""
+    def decrypt(self, ciphertext: bytes, key: bytes,
+                out: Optional[bytearray] = None) -> Union[bytes, memoryview]:
+        """Decrypt data using SCBE
+        
+        Raises ValueError if the authentication tag does not verify, e.g.
+        for a wrong key or a modified ciphertext.
+        
+        With ``out``, the plaintext is written to the start of that buffer
+        and a memoryview of it is returned; a buffer of ``len(ciphertext)``
+        bytes is always large enough.
+        """
         # Extract salt and actual key
         salt = key[:16]
         actual_key = key[16:48]
         
+        # Verify the tag before touching the ciphertext
+        bs = self.config.block_size
+        if len(ciphertext) < bs + _MAC_SIZE:
+            raise ValueError('ciphertext too short')
+        body, tag = ciphertext[:-_MAC_SIZE], ciphertext[-_MAC_SIZE:]
+        if not hmac.compare_digest(tag, self._mac(body, self._mac_key(actual_key, salt))):
+            raise ValueError('authentication failed')
+        
         # Initialize chaos with key
         self._chaos = ChaosGenerator(actual_key + salt)
         
         # Extract IV
-        iv = ciphertext[:self.config.block_size]
-        data = ciphertext[self.config.block_size:]
-        
-        # Decrypt blocks
-        plaintext = bytearray()
-        prev_block = iv
+        iv = body[:bs]
+        data = body[bs:]
         
-        for i in range(0, len(data), self.config.block_size):
-            block = data[i:i + self.config.block_size]
-            # XOR with chaos stream
-            chaos_stream = self._chaos.generate_stream(self.config.block_size)
-            xored = bytes(a ^ b for a, b in zip(block, chaos_stream))
-            # XOR with previous block
-            decrypted = bytes(a ^ b for a, b in zip(xored, prev_block))
-            plaintext.extend(decrypted)
-            prev_block = block
+        # Decrypt all blocks at once; a trailing partial block is zero-filled
+        # here and cut off again below
+        n_blocks = -(-len(data) // bs)
+        blocks = np.zeros((n_blocks, bs), dtype=np.uint8)
+        blocks.reshape(-1)[:len(data)] = np.frombuffer(data, dtype=np.uint8)
+        prev_blocks = np.empty_like(blocks)
+        if n_blocks:
+            prev_blocks[0] = np.frombuffer(iv, dtype=np.uint8)
+            prev_blocks[1:] = blocks[:-1]
+        if out is None:
+            plaintext = blocks ^ self._chaos_blocks(n_blocks) ^ prev_blocks
+            return self._unpad(plaintext.tobytes()[:len(data)])
         
-        return self._unpad(bytes(plaintext))
+        view = self._out_view(out, n_blocks * bs)
+        plaintext = np.frombuffer(view, dtype=np.uint8).reshape(n_blocks, bs)
+        np.bitwise_xor(blocks, self._chaos_blocks(n_blocks), out=plaintext)
+        plaintext ^= prev_blocks
+        # Slicing a memoryview copies nothing, so unpadding stays in place
+        return self._unpad(view[:len(data)])
+    
+    @staticmethod
+    def _out_view(out: bytearray, size: int) -> memoryview:
+        """First ``size`` bytes of a caller-supplied output buffer"""
+        if len(out) < size:
+            raise ValueError(f'output buffer too small: need {size} bytes, got {len(out)}')
+        return memoryview(out)[:size]
+    
+    @staticmethod
+    def _mac_key(actual_key: bytes, salt: bytes) -> bytes:
+        """Authentication key, kept separate from the chaos stream seed"""
+        return hashlib.sha3_256(b'SCBE-MAC' + actual_key + salt).digest()
+    
+    @staticmethod
+    def _mac(data: Union[bytes, memoryview], mac_key: bytes) -> bytes:
+        """Authentication tag over data"""
+        return hmac.new(mac_key, data, hashlib.sha3_256).digest()
+    
+    def _chaos_blocks(self, n_blocks: int) -> np.ndarray:
+        """Per-block chaos streams as an (n_blocks, block_size) array"""
+        return self._chaos.generate_blocks(n_blocks, self.config.block_size)
     
     def _pad(self, data: bytes) -> bytes:
         """PKCS7 padding"""
         pad_len = self.config.block_size - (len(data) % self.config.block_size)
         return data + bytes([pad_len] * pad_len)
     
-    def _unpad(self, data: bytes) -> bytes:
+    def _unpad(self, data: Union[bytes, memoryview]) -> Union[bytes, memoryview]:
         """Remove PKCS7 padding"""
         pad_len = data[-1]
         return data[:-pad_len]
@@ -9,6 +9,7 @@ Architecture:
 - LWS Core: Semantic binding and verification
 """
 
+import functools
 import hashlib
 from typing import Dict, Optional, Tuple, Any
 from dataclasses import dataclass
@@ -16,11 +17,71 @@ import json
 import base64
 import time
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 from .scbe_engine import SCBEEngine
 from .aethermoore_geometry import HyperbolicSpace, SpiralverseGeometry, HyperbolicPoint
 from .lws_core import LWSEngine, LWSCryptoBinding
 
 
+# Types orjson serializes exactly like the stdlib; floats are excluded
+# because the two spell exponents and NaN differently
+_ORJSON_SCALARS = (str, int, bool, type(None))
+
+
+def _orjson_safe(obj: Any) -> bool:
+    """Whether orjson's output for obj matches the canonical stdlib form"""
+    if type(obj) in _ORJSON_SCALARS:
+        return True
+    if type(obj) is dict:
+        return all(type(k) in _ORJSON_SCALARS and _orjson_safe(v) for k, v in obj.items())
+    if type(obj) in (list, tuple):
+        return all(_orjson_safe(v) for v in obj)
+    return False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when available.
+    
+    The canonical form is the stdlib encoder with compact separators and
+    raw UTF-8. Payload bytes feed the geometric signature, so orjson is
+    only used for values it renders identically; everything else, and
+    anything orjson rejects (e.g. integers over 64 bits), goes through
+    the stdlib.
+    """
+    if orjson is not None and _orjson_safe(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Big integers and NaN/Infinity literals are stdlib-only
+            pass
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _derive_cached(master_key: bytes) -> bytes:
+    """SCBE key for a master key, derived once per process.
+    
+    Derivation runs PBKDF2 plus the chaos rounds, so repeated
+    SpiralverseSystem construction reuses the result. The trade-off is
+    that up to 32 derived keys stay in process memory until exit.
+    """
+    return SCBEEngine().derive_key(master_key)
+
+
 @dataclass
 class AuthorizationToken:
     """Quantum-resistant authorization token."""
@@ -59,10 +120,16 @@ class SpiralverseSystem:
     VERSION = '1.0.0'
     PROTOCOL_ID = 'SPIRALVERSE-AETHERMOORE-QR'
     
-    def __init__(self, master_key: bytes):
+    def __init__(self, master_key: bytes, derived_key: Optional[bytes] = None):
         self.master_key = master_key
         self.scbe = SCBEEngine()
-        self.derived_key = self.scbe.derive_key(master_key)
+        # A caller holding an already derived key (e.g. from a KMS) skips the KDF
+        self.derived_key = derived_key if derived_key is not None else _derive_cached(master_key)
+        # BLAKE2b keys are capped at 64 bytes; longer derived keys are hashed down
+        if len(self.derived_key) <= hashlib.blake2b.MAX_KEY_SIZE:
+            self._token_id_key = self.derived_key
+        else:
+            self._token_id_key = hashlib.blake2b(self.derived_key).digest()
         self.hyperbolic = HyperbolicSpace(self.derived_key)
         self.geometry = SpiralverseGeometry(self.hyperbolic)
         self.lws = LWSEngine()
@@ -71,7 +138,9 @@ class SpiralverseSystem:
     def _generate_token_id(self) -> str:
         """Generate unique token identifier."""
         timestamp = str(time.time()).encode()
-        random_component = hashlib.sha256(self.derived_key + timestamp).digest()[:8]
+        random_component = hashlib.blake2b(
+            timestamp, digest_size=8, key=self._token_id_key
+        ).digest()
         return f"{self.PROTOCOL_ID}-{random_component.hex().upper()}"
     
     def create_authorization(self, subject: str, payload: Dict[str, Any], 
@@ -81,7 +150,7 @@ class SpiralverseSystem:
         timestamp = time.time()
         
         # Serialize payload
-        payload_bytes = json.dumps(payload).encode()
+        payload_bytes = _json_dumps(payload)
         
         # Generate geometric signature via hyperbolic trajectory
         subject_point = self.hyperbolic.encode_point(subject.encode())
@@ -128,7 +197,7 @@ class SpiralverseSystem:
         # Decrypt payload
         try:
             decrypted = self.scbe.decrypt(token.encrypted_payload, combined_key)
-            payload = json.loads(decrypted.decode())
+            payload = _json_loads(decrypted)
             
             # Verify geometric integrity
             subject_point = self.hyperbolic.encode_point(token.subject.encode())
@@ -142,13 +211,11 @@ class SpiralverseSystem:
     
     def export_token(self, token: AuthorizationToken) -> str:
         """Export token as portable string."""
-        return base64.b64encode(
-            json.dumps(token.to_dict()).encode()
-        ).decode()
+        return base64.b64encode(_json_dumps(token.to_dict())).decode()
     
     def import_token(self, token_str: str) -> AuthorizationToken:
         """Import token from portable string."""
-        data = json.loads(base64.b64decode(token_str).decode())
+        data = _json_loads(base64.b64decode(token_str))
         return AuthorizationToken.from_dict(data)
 
 
@@ -173,10 +240,11 @@ class ConsensusValidator:
     
     def compute_consensus_hash(self, tokens: list) -> bytes:
         """Compute consensus hash from multiple tokens."""
-        combined = b''
-        for token in tokens:
-            combined += token.geometric_signature
-            combined += token.semantic_binding
+        combined = b''.join(
+            part
+            for token in tokens
+            for part in (token.geometric_signature, token.semantic_binding)
+        )
         return hashlib.sha512(combined).digest()
 
 
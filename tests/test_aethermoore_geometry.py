@@ -0,0 +1,77 @@
+"""Test suite for AetherMoore geometry."""
+
+import numpy as np
+import pytest
+
+from src import aethermoore_geometry
+from src.aethermoore_geometry import HyperbolicPoint, HyperbolicSpace, _traverse_tile_from_env
+
+
+@pytest.fixture(scope='module')
+def space():
+    return HyperbolicSpace(b'aethermoore-geometry-test-key')
+
+
+class TestGeodesicPath:
+    """Tests for HyperbolicSpace.geodesic_path."""
+    
+    def test_endpoints(self, space):
+        """Test the path starts and ends at the given points."""
+        path = space.geodesic_path(0.1 + 0.2j, -0.3 + 0.4j, steps=8)
+        
+        assert len(path) == 9
+        assert path[0] == pytest.approx(0.1 + 0.2j)
+        assert path[-1] == pytest.approx(-0.3 + 0.4j)
+    
+    @pytest.mark.parametrize('steps', [0, -1])
+    def test_rejects_non_positive_steps(self, space, steps):
+        """Test steps below 1 raise ValueError."""
+        with pytest.raises(ValueError):
+            space.geodesic_path(0.1j, 0.5, steps=steps)
+
+
+@pytest.fixture(scope='module')
+def points():
+    """10001 reproducible points inside the unit disk."""
+    rng = np.random.default_rng(1)
+    radius = 0.95 * np.sqrt(rng.random(10001))
+    return radius * np.exp(2j * np.pi * rng.random(10001))
+
+
+class TestTraverseTile:
+    """Tests for tiling in HyperbolicSpace.traverse_layers_batch."""
+    
+    @pytest.mark.parametrize('value, expected', [
+        ('256', 256), ('0', 1), ('-5', 1), ('', 4096), ('4k', 4096), ('1.5', 4096),
+    ])
+    def test_env_parsing(self, monkeypatch, value, expected):
+        """Test malformed SPIRALVERSE_TRAVERSE_TILE values fall back to 4096."""
+        monkeypatch.setenv('SPIRALVERSE_TRAVERSE_TILE', value)
+        
+        assert _traverse_tile_from_env() == expected
+    
+    def test_env_unset(self, monkeypatch):
+        """Test the default tile is used when the variable is unset."""
+        monkeypatch.delenv('SPIRALVERSE_TRAVERSE_TILE', raising=False)
+        
+        assert _traverse_tile_from_env() == 4096
+    
+    def test_multi_tile_matches_default(self, monkeypatch, space, points):
+        """Test a ragged multi-tile batch is bit-identical to the default tiling."""
+        expected = space.traverse_layers_batch(points)
+        monkeypatch.setattr(aethermoore_geometry, '_TRAVERSE_TILE', 7)
+        
+        trajectories = space.traverse_layers_batch(points)
+        
+        assert trajectories.shape == (10001, 14)
+        assert np.array_equal(trajectories, expected)
+    
+    def test_batch_matches_scalar(self, monkeypatch, space, points):
+        """Test batch rows are bit-identical to per-point traversals."""
+        monkeypatch.setattr(aethermoore_geometry, '_TRAVERSE_TILE', 7)
+        trajectories = space.traverse_layers_batch(points)
+        
+        for i in range(0, len(points), 97):
+            point = HyperbolicPoint(complex(points[i]))
+            scalar = [p.z for p in space.traverse_layers(point)]
+            assert trajectories[i].tolist() == scalar
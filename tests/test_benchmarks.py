@@ -0,0 +1,42 @@
+"""Throughput benchmarks for the SCBE encrypt/decrypt hot path."""
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from src.scbe_engine import SCBEEngine
+
+
+PLAINTEXT = bytes(range(256)) * 256  # 64 KiB
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return SCBEEngine()
+
+
+@pytest.fixture(scope='module')
+def key(engine):
+    """Derive the benchmark key once; the KDF is not what is measured."""
+    return engine.derive_key(b'benchmark-key', salt=bytes(16))
+
+
+def _record_throughput(benchmark, size):
+    """Attach MiB/s, from the mean round time, to the benchmark report.
+    
+    No stats exist when benchmarking is disabled (--benchmark-disable, xdist).
+    """
+    if benchmark.stats is not None:
+        benchmark.extra_info['MiB/s'] = size / benchmark.stats.stats.mean / (1 << 20)
+
+
+def test_encrypt_benchmark(benchmark, engine, key):
+    benchmark.pedantic(engine.encrypt, args=(PLAINTEXT, key), rounds=50, iterations=10)
+    _record_throughput(benchmark, len(PLAINTEXT))
+
+
+def test_decrypt_benchmark(benchmark, engine, key):
+    ciphertext = engine.encrypt(PLAINTEXT, key)
+    result = benchmark.pedantic(engine.decrypt, args=(ciphertext, key), rounds=50, iterations=10)
+    _record_throughput(benchmark, len(ciphertext))
+    assert result == PLAINTEXT
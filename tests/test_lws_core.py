@@ -0,0 +1,60 @@
+"""Test suite for the LWS core."""
+
+import hashlib
+import math
+import random
+import struct
+
+import pytest
+
+from src.lws_core import LWSEngine
+
+
+def reference_sacred_hash(engine, text):
+    """sacred_hash written out token by token from the LWS formula."""
+    terms = []
+    letters = [char for char in text.lower() if char.isalpha()]
+    for position, char in enumerate(letters):
+        base = float(engine.gematria_map.get(char, 1))
+        phonetic = engine.phonetic_map.get(char, engine.DEFAULT_PHONETIC)
+        context = 1.0 + 0.1 * math.sin(position * engine.PHI)
+        weight = base * (sum(phonetic.to_array()) / 4.0) * context
+        terms.append(weight * engine.SACRED_PRIMES[position % len(engine.SACRED_PRIMES)])
+    # Builtin sum, as in the original implementation (compensated on 3.12+)
+    combined = sum(terms)
+    combined *= (engine.compute_gematria(text) / 1000.0 + 1)
+    return hashlib.sha256(struct.pack('>d', combined) + text.encode()).digest()
+
+
+def random_texts(count, seed=0):
+    rng = random.Random(seed)
+    alphabet = 'abcdefghijklmnopqrstuvwxyz ABCXYZ-éßא'
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randrange(0, 80)))
+            for _ in range(count)]
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return LWSEngine()
+
+
+class TestSacredHash:
+    """sacred_hash must agree with the per-token formula on every Python."""
+    
+    @pytest.mark.parametrize('text', ['', 'AetherMoore Quantum Sacred', 'shalom', 'ünïcödé'])
+    def test_matches_reference(self, engine, text):
+        """Test fixed texts, including empty and non-ASCII input."""
+        assert engine.sacred_hash(text) == reference_sacred_hash(engine, text)
+    
+    def test_matches_reference_random(self, engine):
+        """Test many random texts, where summation rounding differences show."""
+        for text in random_texts(500):
+            assert engine.sacred_hash(text) == reference_sacred_hash(engine, text), text
+    
+    def test_token_weights_match_formula(self, engine):
+        """Test LWSToken.computed_weight matches the weights the hash uses."""
+        text = 'Spiralverse Sacred Tongues héllo'
+        soa = engine._tokenize_soa(text)
+        weights = soa['base'] * soa['phonetic_factor'] * soa['context']
+        
+        assert [t.computed_weight for t in engine.tokenize(text)] == weights.tolist()
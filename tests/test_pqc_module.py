@@ -0,0 +1,288 @@
+"""Test suite for PQC backend selection and the liboqs code paths."""
+
+import functools
+
+import pytest
+
+from spiralverse.crypto import pqc_module
+from spiralverse.crypto.pqc_module import (
+    DilithiumPrivateKey,
+    DilithiumPublicKey,
+    DilithiumSign,
+    KyberKEM,
+    KyberPrivateKey,
+    KyberPublicKey,
+    PQCModule,
+    _OQS_KEM_NAMES,
+    _OQS_SIG_NAMES,
+    _VERIFY_CACHE_MAX_MESSAGE,
+    _select_backend,
+    _verify_digest,
+)
+
+
+KEM_DETAILS = {
+    'length_public_key': 11,
+    'length_secret_key': 12,
+    'length_ciphertext': 13,
+    'length_shared_secret': 14,
+}
+SIG_DETAILS = {
+    'length_public_key': 21,
+    'length_secret_key': 22,
+    'length_signature': 23,
+}
+
+
+class FakeContext:
+    """Stand-in for an oqs context that records its calls on the fake module."""
+    
+    details = {}
+    
+    def __init__(self, oqs, alg, secret_key=None):
+        self.oqs = oqs
+        self.alg = alg
+        self.secret_key = secret_key
+        self.freed = False
+        oqs.contexts.append(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.free()
+    
+    def free(self):
+        self.freed = True
+    
+    def record(self, name, *args):
+        self.oqs.calls.append((name, self.alg, self.secret_key) + args)
+
+
+class FakeKeyEncapsulation(FakeContext):
+    details = KEM_DETAILS
+    
+    def generate_keypair(self):
+        self.record('generate_keypair')
+        return b'kem-pk'
+    
+    def export_secret_key(self):
+        return b'kem-sk'
+    
+    def encap_secret(self, pk):
+        self.record('encap_secret', pk)
+        return b'kem-ct', b'kem-ss'
+    
+    def decap_secret(self, ct):
+        self.record('decap_secret', ct)
+        return b'kem-ss'
+
+
+class FakeSignature(FakeContext):
+    details = SIG_DETAILS
+    
+    def generate_keypair(self):
+        self.record('generate_keypair')
+        return b'sig-pk'
+    
+    def export_secret_key(self):
+        return b'sig-sk'
+    
+    def sign(self, message):
+        self.record('sign', message)
+        return b'signature'
+    
+    def verify(self, message, signature, pk):
+        self.record('verify', message, signature, pk)
+        return signature == b'signature'
+
+
+class FakeOQS:
+    """Minimal oqs module exposing the second KEM and the first signature name."""
+    
+    def __init__(self, kems=(_OQS_KEM_NAMES[1],), sigs=(_OQS_SIG_NAMES[0],)):
+        self.kems = list(kems)
+        self.sigs = list(sigs)
+        self.calls = []
+        self.contexts = []
+        self.KeyEncapsulation = functools.partial(FakeKeyEncapsulation, self)
+        self.Signature = functools.partial(FakeSignature, self)
+    
+    def get_enabled_kem_mechanisms(self):
+        return self.kems
+    
+    def get_enabled_sig_mechanisms(self):
+        return self.sigs
+
+
+@pytest.fixture
+def fake_oqs(monkeypatch):
+    """Route every liboqs lookup to a fresh FakeOQS."""
+    oqs = FakeOQS()
+    monkeypatch.setattr(pqc_module, '_load_oqs', lambda: oqs)
+    return oqs
+
+
+@pytest.fixture
+def no_oqs(monkeypatch):
+    """Behave as if the oqs bindings are not installed."""
+    monkeypatch.setattr(pqc_module, '_load_oqs', lambda: None)
+
+
+class TestSelectBackend:
+    """Tests for resolving the backend argument."""
+    
+    def test_unknown_backend_rejected(self, fake_oqs):
+        """Test a backend name other than None/'oqs'/'sim' raises."""
+        with pytest.raises(ValueError, match='Unknown PQC backend'):
+            _select_backend('liboqs', _OQS_KEM_NAMES)
+        with pytest.raises(ValueError, match='Unknown PQC backend'):
+            KyberKEM(backend='liboqs')
+    
+    def test_oqs_without_bindings_raises(self, no_oqs):
+        """Test requesting liboqs without usable bindings raises."""
+        with pytest.raises(ValueError, match='no usable oqs bindings'):
+            _select_backend('oqs', _OQS_KEM_NAMES)
+        with pytest.raises(ValueError, match='no usable oqs bindings'):
+            DilithiumSign(backend='oqs')
+    
+    def test_oqs_without_mechanism_raises(self, fake_oqs):
+        """Test requesting liboqs raises when no candidate is enabled."""
+        fake_oqs.kems = ['FrodoKEM-640-AES']
+        
+        with pytest.raises(ValueError, match='no usable oqs bindings'):
+            _select_backend('oqs', _OQS_KEM_NAMES)
+        assert _select_backend(None, _OQS_KEM_NAMES) == ('sim', None)
+    
+    def test_sim_forced(self, fake_oqs):
+        """Test 'sim' is used even when liboqs is available."""
+        assert _select_backend('sim', _OQS_KEM_NAMES) == ('sim', None)
+        assert KyberKEM(backend='sim').backend == 'sim'
+        assert DilithiumSign(backend='sim').backend == 'sim'
+        assert fake_oqs.contexts == []
+    
+    def test_default_falls_back_to_sim(self, no_oqs):
+        """Test the default backend simulates when liboqs is missing."""
+        assert _select_backend(None, _OQS_SIG_NAMES, signature=True) == ('sim', None)
+        assert PQCModule().kem.backend == 'sim'
+    
+    def test_default_prefers_oqs(self, fake_oqs):
+        """Test the first enabled candidate of the right kind is chosen."""
+        assert _select_backend(None, _OQS_KEM_NAMES) == ('oqs', _OQS_KEM_NAMES[1])
+        assert _select_backend(None, _OQS_SIG_NAMES, signature=True) == (
+            'oqs', _OQS_SIG_NAMES[0])
+
+
+class TestOQSBackend:
+    """Tests for KyberKEM and DilithiumSign on a fake liboqs."""
+    
+    def test_sizes_from_details(self, fake_oqs):
+        """Test instance sizes come from the mechanism details."""
+        kem = KyberKEM()
+        sig = DilithiumSign()
+        
+        assert (kem.PK_SIZE, kem.SK_SIZE, kem.CT_SIZE, kem.SS_SIZE) == (11, 12, 13, 14)
+        assert (sig.PK_SIZE, sig.SK_SIZE, sig.SIG_SIZE) == (21, 22, 23)
+        assert KyberKEM.PK_SIZE == 1568
+        assert DilithiumSign.SIG_SIZE == 4627
+    
+    def test_encapsulator_reused(self, fake_oqs):
+        """Test encapsulations share one context until close()."""
+        kem = KyberKEM()
+        pk = KyberPublicKey(b'kem-pk')
+        kem.encapsulate(pk)
+        kem.encapsulate(pk)
+        
+        assert len(fake_oqs.contexts) == 1
+        first = fake_oqs.contexts[0]
+        
+        kem.close()
+        assert first.freed
+        assert kem._encapsulator is None
+        
+        kem.encapsulate(pk)
+        assert len(fake_oqs.contexts) == 2
+        assert not fake_oqs.contexts[1].freed
+        kem.close()
+        kem.close()
+    
+    def test_verifier_reused(self, fake_oqs):
+        """Test verifications share one context until close()."""
+        sig = DilithiumSign()
+        pk = DilithiumPublicKey(b'sig-pk')
+        sig.verify(pk, b'message', b'signature')
+        sig.verify(pk, b'message', b'signature')
+        
+        assert len(fake_oqs.contexts) == 1
+        
+        sig.close()
+        assert fake_oqs.contexts[0].freed
+        
+        sig.verify(pk, b'message', b'signature')
+        assert len(fake_oqs.contexts) == 2
+    
+    def test_module_close(self, fake_oqs):
+        """Test PQCModule.close() frees both cached contexts."""
+        pqc = PQCModule()
+        pqc.close()
+        
+        assert len(fake_oqs.contexts) == 2
+        assert all(context.freed for context in fake_oqs.contexts)
+    
+    def test_kem_dispatch(self, fake_oqs):
+        """Test KEM operations are delegated to liboqs."""
+        kem = KyberKEM()
+        alg = _OQS_KEM_NAMES[1]
+        
+        pk, sk = kem.keygen()
+        ct, ss = kem.encapsulate(pk)
+        
+        assert (pk.pk_bytes, sk.sk_bytes) == (b'kem-pk', b'kem-sk')
+        assert (ct, ss) == (b'kem-ct', b'kem-ss')
+        assert kem.decapsulate(sk, ct) == b'kem-ss'
+        assert fake_oqs.calls == [
+            ('generate_keypair', alg, None),
+            ('encap_secret', alg, None, b'kem-pk'),
+            ('decap_secret', alg, b'kem-sk', b'kem-ct'),
+        ]
+    
+    def test_sig_dispatch(self, fake_oqs):
+        """Test signature operations are delegated to liboqs."""
+        sig = DilithiumSign()
+        alg = _OQS_SIG_NAMES[0]
+        
+        pk, sk = sig.keygen()
+        signature = sig.sign(sk, b'message')
+        
+        assert (pk.pk_bytes, sk.sk_bytes) == (b'sig-pk', b'sig-sk')
+        assert sig.verify(pk, b'message', signature)
+        assert not sig.verify(pk, b'message', b'forged')
+        assert fake_oqs.calls == [
+            ('generate_keypair', alg, None),
+            ('sign', alg, b'sig-sk', b'message'),
+            ('verify', alg, None, b'message', b'signature', b'sig-pk'),
+            ('verify', alg, None, b'message', b'forged', b'sig-pk'),
+        ]
+    
+    def test_private_key_types(self, fake_oqs):
+        """Test keygen wraps liboqs bytes in the module's key types."""
+        _, kem_sk = KyberKEM().keygen()
+        _, sig_sk = DilithiumSign().keygen()
+        
+        assert isinstance(kem_sk, KyberPrivateKey)
+        assert isinstance(sig_sk, DilithiumPrivateKey)
+
+
+class TestSimulatedVerify:
+    """Tests for the simulated Dilithium verification digest."""
+    
+    @pytest.mark.parametrize('size', [0, _VERIFY_CACHE_MAX_MESSAGE,
+                                      _VERIFY_CACHE_MAX_MESSAGE + 1])
+    def test_cached_and_uncached_agree(self, no_oqs, size):
+        """Test messages on either side of the cache limit verify alike."""
+        sig = DilithiumSign()
+        pk = DilithiumPublicKey(bytes(range(64)) * 2)
+        message = b'm' * size
+        
+        assert sig.verify(pk, message, _verify_digest(pk.pk_bytes[:64], message))
+        assert not sig.verify(pk, message, bytes(64))
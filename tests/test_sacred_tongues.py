@@ -0,0 +1,177 @@
+"""Test suite for the Six Sacred Tongues layer."""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from spiralverse.core.sacred_tongues import (
+    LanguesWeight,
+    SacredTongue,
+    SacredTongueEncoder,
+    SixTonguesLayer,
+    TongueWeight,
+    _SHAKE_CACHE_MAX_LENGTH,
+)
+
+
+DATA = b'Spiralverse-AetherMoore Sacred Tongues Test'
+
+
+def sequential_encode(lws, data, tongues):
+    """Reference encoding: one tongue at a time, with a fresh encoder."""
+    snapshot = LanguesWeight({
+        tongue: TongueWeight(tongue, tw.weight, tw.harmonic_factor)
+        for tongue, tw in lws.weights.items()
+    })
+    encoder = SacredTongueEncoder(snapshot)
+    for tongue in tongues:
+        data = encoder.encode(data, tongue)
+    return data
+
+
+@pytest.fixture
+def layer():
+    return SixTonguesLayer()
+
+
+class TestCacheInvalidation:
+    """Cached seeds and keystreams must follow every weight change."""
+    
+    def test_full_encode_matches_sequential(self, layer):
+        """Test the fused pass equals applying all six tongues in turn."""
+        assert layer.full_encode(DATA) == sequential_encode(layer.lws, DATA, list(SacredTongue))
+    
+    def test_set_weight(self, layer):
+        """Test set_weight changes the encoding."""
+        before = layer.full_encode(DATA)
+        layer.lws.set_weight(SacredTongue.KHAZUL, 0.9)
+        
+        after = layer.full_encode(DATA)
+        
+        assert after != before
+        assert after == sequential_encode(layer.lws, DATA, list(SacredTongue))
+    
+    def test_normalize(self, layer):
+        """Test normalize changes the encoding."""
+        # Defaults already sum to 1.0; skew them so normalize has work to do
+        layer.lws.set_weight(SacredTongue.KHAZUL, 0.5)
+        before = layer.full_encode(DATA)
+        layer.lws.normalize()
+        
+        after = layer.full_encode(DATA)
+        
+        assert after != before
+        assert after == sequential_encode(layer.lws, DATA, list(SacredTongue))
+    
+    def test_weight_view_edit(self, layer):
+        """Test editing weights[t].weight changes the encoding."""
+        before = layer.full_encode(DATA)
+        layer.lws.weights[SacredTongue.NYTHARA].weight = 0.6
+        
+        after = layer.full_encode(DATA)
+        
+        assert layer.lws.get_weight(SacredTongue.NYTHARA) == 0.6
+        assert after != before
+        assert after == sequential_encode(layer.lws, DATA, list(SacredTongue))
+    
+    @pytest.mark.parametrize('mutate', [
+        lambda weights: weights.__setitem__(
+            SacredTongue.KHAZUL, TongueWeight(SacredTongue.KHAZUL, 0.9)),
+        lambda weights: weights.__delitem__(SacredTongue.KHAZUL),
+        lambda weights: weights.setdefault(SacredTongue.KHAZUL),
+        lambda weights: weights.update({}),
+        lambda weights: weights.clear(),
+    ])
+    def test_weights_mapping_is_read_only(self, layer, mutate):
+        """Test writes to weights raise instead of being silently dropped."""
+        before = layer.full_encode(DATA)
+        
+        with pytest.raises(TypeError):
+            mutate(layer.lws.weights)
+        
+        assert layer.lws.get_weight(SacredTongue.KHAZUL) == 0.15
+        assert layer.full_encode(DATA) == before
+
+
+class TestCopying:
+    """Copies of a LanguesWeight are independent and equal to the original."""
+    
+    @pytest.mark.parametrize('clone', [
+        copy.copy,
+        copy.deepcopy,
+        lambda lws: pickle.loads(pickle.dumps(lws)),
+    ])
+    def test_clone(self, clone):
+        """Test copy, deepcopy and pickle preserve weights and stay detached."""
+        lws = LanguesWeight()
+        lws.set_weight(SacredTongue.KHAZUL, 0.4, 2.0)
+        
+        cloned = clone(lws)
+        cloned.set_weight(SacredTongue.KHAZUL, 0.1)
+        
+        assert lws.get_weight(SacredTongue.KHAZUL) == 0.8
+        assert cloned.get_weight(SacredTongue.KHAZUL) == pytest.approx(0.2)
+        cloned.set_weight(SacredTongue.KHAZUL, 0.4)
+        assert cloned == lws
+        assert SixTonguesLayer(cloned).full_encode(DATA) == SixTonguesLayer(lws).full_encode(DATA)
+    
+    def test_asdict(self):
+        """Test dataclasses.asdict gives plain nested dicts of the weights."""
+        result = dataclasses.asdict(LanguesWeight({
+            SacredTongue.AELINDRA: TongueWeight(SacredTongue.AELINDRA, 0.5, 2.0),
+        }))
+        
+        assert result == {'weights': {SacredTongue.AELINDRA: {
+            'tongue': SacredTongue.AELINDRA, 'weight': 0.5, 'harmonic_factor': 2.0,
+        }}}
+        assert type(result['weights']) is dict
+
+
+class TestRoundtrip:
+    """full_decode must invert full_encode whether or not it hits the caches."""
+    
+    @pytest.mark.parametrize('length', [
+        0, 1, 4096, _SHAKE_CACHE_MAX_LENGTH, _SHAKE_CACHE_MAX_LENGTH + 1,
+    ])
+    def test_roundtrip_lengths(self, layer, length):
+        """Test roundtrip on both sides of the keystream cache limit."""
+        data = bytes(range(256)) * (length // 256) + bytes(range(length % 256))
+        
+        encoded = layer.full_encode(data)
+        
+        assert layer.full_decode(encoded) == data
+        assert encoded == sequential_encode(layer.lws, data, list(SacredTongue))
+    
+    def test_roundtrip_past_cache_size(self, layer):
+        """Test roundtrip stays correct once old keystreams are evicted."""
+        lengths = range(1, SixTonguesLayer.KEYSTREAM_CACHE_SIZE + 17)
+        encoded = {n: layer.full_encode(bytes(range(n % 256)) * (n // 256 + 1)) for n in lengths}
+        
+        assert len(layer._ks_cache) == SixTonguesLayer.KEYSTREAM_CACHE_SIZE
+        for n, ciphertext in encoded.items():
+            assert layer.full_decode(ciphertext) == bytes(range(n % 256)) * (n // 256 + 1)
+
+
+class TestWeightedEncode:
+    """weighted_encode must match the sequential encoder chain."""
+    
+    @pytest.mark.parametrize('tongues', [
+        [],
+        [SacredTongue.AELINDRA],
+        [SacredTongue.AELINDRA, SacredTongue.AELINDRA],
+        [SacredTongue.KHAZUL, SacredTongue.DRAKMORI, SacredTongue.KHAZUL],
+    ])
+    def test_matches_sequential(self, layer, tongues):
+        """Test empty and duplicated tongue lists."""
+        assert layer.weighted_encode(DATA, tongues) == sequential_encode(layer.lws, DATA, tongues)
+    
+    def test_skips_tongues_below_threshold(self, layer):
+        """Test tongues at or below WEIGHT_THRESHOLD are left out."""
+        layer.lws.set_weight(SacredTongue.KHAZUL, SixTonguesLayer.WEIGHT_THRESHOLD)
+        tongues = [SacredTongue.AELINDRA, SacredTongue.KHAZUL]
+        
+        encoded = layer.weighted_encode(DATA, tongues)
+        
+        assert encoded == sequential_encode(layer.lws, DATA, [SacredTongue.AELINDRA])
@@ -1,39 +1,90 @@
 """Test suite for SCBE Engine."""
 
+import statistics
+import time
+
 import pytest
-import sys
-sys.path.insert(0, '..')
 
 from src.scbe_engine import SCBEEngine
 
 
+@pytest.fixture(scope='session')
+def keys():
+    """Derive each test key once per session; the KDF dominates test time."""
+    engine = SCBEEngine()
+    passwords = {
+        'roundtrip': b'roundtrip-test',
+        'diff': b'diff-test',
+        'correct': b'correct-key',
+        'wrong': b'wrong-key',
+        'empty': b'empty-test',
+        'large': b'large-test',
+    }
+    return {name: engine.derive_key(pw) for name, pw in passwords.items()}
+
+
+# Fixed salt so derivations are reproducible across calls
+KDF_SALT = bytes(16)
+
+# Built once at import rather than on every test_large_message run
+LARGE_PLAINTEXT = b'A' * 10000
+
+ROUNDTRIP_SIZES = [0, 16, 1024, 65536]
+ROUNDTRIP_PLAINTEXTS = {
+    'hello': b'Hello, Quantum World!',
+    **{size: bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+       for size in ROUNDTRIP_SIZES},
+}
+
+
+@pytest.fixture(scope='module')
+def ciphertexts(keys):
+    """Encrypt every roundtrip plaintext in one encrypt_many batch."""
+    names = list(ROUNDTRIP_PLAINTEXTS)
+    batch = SCBEEngine().encrypt_many([ROUNDTRIP_PLAINTEXTS[name] for name in names],
+                                      keys['roundtrip'])
+    return dict(zip(names, batch))
+
+
+@pytest.fixture(scope='module')
+def derived():
+    """Derive each key-derivation test password once, with the fixed salt."""
+    engine = SCBEEngine()
+    passwords = [b'test-password-123', b'password1', b'password2']
+    return {pw: engine.derive_key(pw, salt=KDF_SALT) for pw in passwords}
+
+
 class TestSCBEEngine:
     """Tests for SCBEEngine class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.engine = SCBEEngine()
+    @pytest.fixture(scope='class', autouse=True)
+    @classmethod
+    def shared_engine(cls):
+        """Share one engine across the class (it holds no per-test state)."""
+        cls.engine = SCBEEngine()
     
-    def test_key_derivation(self):
+    def test_key_derivation(self, derived):
         """Test key derivation produces consistent keys."""
         password = b'test-password-123'
-        key1 = self.engine.derive_key(password)
-        key2 = self.engine.derive_key(password)
+        key = self.engine.derive_key(password, salt=KDF_SALT)
         
         # Same password with same salt should produce same key
-        assert len(key1) == 32
-        assert key1 == key2
+        # (returned as the 16-byte salt followed by the 32-byte key)
+        assert len(key) == 48
+        assert key == derived[password]
+        assert key[:16] == KDF_SALT
     
-    def test_key_derivation_different_passwords(self):
+    @pytest.mark.parametrize('password1, password2', [
+        (b'password1', b'password2'),
+        (b'test-password-123', b'password1'),
+    ])
+    def test_key_derivation_different_passwords(self, derived, password1, password2):
         """Test different passwords produce different keys."""
-        key1 = self.engine.derive_key(b'password1')
-        key2 = self.engine.derive_key(b'password2')
-        
-        assert key1 != key2
+        assert derived[password1] != derived[password2]
     
-    def test_encrypt_decrypt_roundtrip(self):
+    def test_encrypt_decrypt_roundtrip(self, keys):
         """Test encryption and decryption roundtrip."""
-        key = self.engine.derive_key(b'roundtrip-test')
+        key = keys['roundtrip']
         plaintext = b'Hello, Quantum World!'
         
         ciphertext = self.engine.encrypt(plaintext, key)
@@ -41,9 +92,29 @@ class TestSCBEEngine:
         
         assert decrypted == plaintext
     
-    def test_ciphertext_is_different(self):
+    @pytest.mark.parametrize('name', list(ROUNDTRIP_PLAINTEXTS))
+    def test_encrypt_many_roundtrip(self, keys, ciphertexts, name):
+        """Test batch-encrypted messages decrypt like single encryptions."""
+        plaintext = ROUNDTRIP_PLAINTEXTS[name]
+        ciphertext = ciphertexts[name]
+        
+        assert len(ciphertext) == self.engine.ciphertext_size(len(plaintext))
+        assert self.engine.decrypt(ciphertext, keys['roundtrip']) == plaintext
+    
+    @pytest.mark.parametrize('size', ROUNDTRIP_SIZES)
+    def test_roundtrip_sizes(self, keys, size):
+        """Test roundtrip across empty, single-block and multi-block sizes."""
+        key = keys['roundtrip']
+        plaintext = ROUNDTRIP_PLAINTEXTS[size]
+        
+        ciphertext = self.engine.encrypt(plaintext, key)
+        decrypted = self.engine.decrypt(ciphertext, key)
+        
+        assert decrypted == plaintext
+    
+    def test_ciphertext_is_different(self, keys):
         """Test that ciphertext differs from plaintext."""
-        key = self.engine.derive_key(b'diff-test')
+        key = keys['diff']
         plaintext = b'Secret message'
         
         ciphertext = self.engine.encrypt(plaintext, key)
@@ -51,20 +122,47 @@ class TestSCBEEngine:
         assert ciphertext != plaintext
         assert len(ciphertext) > len(plaintext)
     
-    def test_wrong_key_fails(self):
+    def test_wrong_key_fails(self, keys):
         """Test decryption with wrong key fails."""
-        key1 = self.engine.derive_key(b'correct-key')
-        key2 = self.engine.derive_key(b'wrong-key')
+        key1 = keys['correct']
+        key2 = keys['wrong']
         plaintext = b'Sensitive data'
         
         ciphertext = self.engine.encrypt(plaintext, key1)
         
-        with pytest.raises(Exception):
+        with pytest.raises(ValueError):
             self.engine.decrypt(ciphertext, key2)
     
-    def test_empty_message(self):
+    def test_tag_rejection_time_is_position_independent(self, keys):
+        """Test rejecting a bad tag takes as long wherever the tag differs."""
+        key = keys['correct']
+        ciphertext = self.engine.encrypt(b'Sensitive data', key)
+        
+        # Flip a bit in the first and in the last tag byte
+        tampered = []
+        for position in (len(ciphertext) - 32, len(ciphertext) - 1):
+            data = bytearray(ciphertext)
+            data[position] ^= 1
+            tampered.append(bytes(data))
+        
+        # Interleave the two cases so drift in machine load hits both equally
+        samples = ([], [])
+        for _ in range(512):
+            for data, timings in zip(tampered, samples):
+                start = time.perf_counter_ns()
+                try:
+                    self.engine.decrypt(data, key)
+                except ValueError:
+                    pass
+                timings.append(time.perf_counter_ns() - start)
+        
+        # Loose bound on the medians: only a gross early exit should trip it
+        ratio = statistics.median(samples[0]) / statistics.median(samples[1])
+        assert 0.5 < ratio < 2.0
+    
+    def test_empty_message(self, keys):
         """Test encryption of empty message."""
-        key = self.engine.derive_key(b'empty-test')
+        key = keys['empty']
         plaintext = b''
         
         ciphertext = self.engine.encrypt(plaintext, key)
@@ -72,14 +170,18 @@ class TestSCBEEngine:
         
         assert decrypted == plaintext
     
-    def test_large_message(self):
+    def test_large_message(self, keys):
         """Test encryption of large message."""
-        key = self.engine.derive_key(b'large-test')
-        plaintext = b'A' * 10000
+        key = keys['large']
+        plaintext = LARGE_PLAINTEXT
         
-        ciphertext = self.engine.encrypt(plaintext, key)
-        decrypted = self.engine.decrypt(ciphertext, key)
+        # Caller-owned buffers: no per-call ciphertext or plaintext objects
+        ciphertext_buf = bytearray(self.engine.ciphertext_size(len(plaintext)))
+        plaintext_buf = bytearray(len(ciphertext_buf))
+        ciphertext = self.engine.encrypt(plaintext, key, out=ciphertext_buf)
+        decrypted = self.engine.decrypt(ciphertext, key, out=plaintext_buf)
         
+        assert len(ciphertext) == len(ciphertext_buf)
         assert decrypted == plaintext
 
 
@@ -0,0 +1,26 @@
+"""Property-based tests for SCBE Engine."""
+
+import pytest
+
+pytest.importorskip('hypothesis')
+
+from hypothesis import given, strategies as st  # noqa: E402
+
+from src.scbe_engine import SCBEEngine  # noqa: E402
+
+
+ENGINE = SCBEEngine()
+
+
+@pytest.fixture(scope='module')
+def key():
+    """Derive the property-test key once; the KDF dominates test time."""
+    return ENGINE.derive_key(b'roundtrip-test')
+
+
+@given(plaintext=st.binary(max_size=4096))
+def test_roundtrip_property(key, plaintext):
+    """Test roundtrip for arbitrary plaintexts under one derived key."""
+    ciphertext = ENGINE.encrypt(plaintext, key)
+    
+    assert ENGINE.decrypt(ciphertext, key) == plaintext
@@ -0,0 +1,55 @@
+"""Test suite for Spiralverse integration."""
+
+import pytest
+
+from src import spiralverse_integration
+from src.scbe_engine import SCBEEngine
+from src.spiralverse_integration import SpiralverseSystem
+
+
+MASTER_KEY = b'spiralverse-integration-test-key'
+
+
+@pytest.fixture
+def derive_calls(monkeypatch):
+    """Record every SCBE key derivation, starting from an empty KDF cache."""
+    calls = []
+    derive_key = SCBEEngine.derive_key
+    
+    def counting_derive_key(self, password, salt=None):
+        calls.append(password)
+        return derive_key(self, password, salt)
+    
+    monkeypatch.setattr(SCBEEngine, 'derive_key', counting_derive_key)
+    spiralverse_integration._derive_cached.cache_clear()
+    yield calls
+    spiralverse_integration._derive_cached.cache_clear()
+
+
+class TestSpiralverseSystem:
+    """Tests for SpiralverseSystem construction."""
+    
+    def test_master_key_derived_once(self, derive_calls):
+        """Test instances for one master key share a single derivation."""
+        first = SpiralverseSystem(MASTER_KEY)
+        second = SpiralverseSystem(MASTER_KEY)
+        
+        assert derive_calls == [MASTER_KEY]
+        assert first.derived_key == second.derived_key
+    
+    def test_derived_key_skips_kdf(self, derive_calls):
+        """Test a supplied derived key is used as is."""
+        derived_key = bytes(range(48))
+        system = SpiralverseSystem(MASTER_KEY, derived_key=derived_key)
+        
+        assert derive_calls == []
+        assert system.derived_key == derived_key
+    
+    def test_long_derived_key_token_id(self, derive_calls):
+        """Test token ids work with derived keys over the BLAKE2b key limit."""
+        system = SpiralverseSystem(MASTER_KEY, derived_key=bytes(100))
+        
+        token_id = system._generate_token_id()
+        
+        assert token_id.startswith(SpiralverseSystem.PROTOCOL_ID + '-')
+        assert len(token_id) == len(SpiralverseSystem.PROTOCOL_ID) + 1 + 16